@@ -131,22 +131,24 @@ async def handle_escrow_objects(events: List[SuiEvent], event_type: str, db: Pri
     
     logger.info(f"💾 Saving {len(updates)} escrow updates to database...")
     
-    # Perform database operations using Prisma upserts
-    for escrow_data in updates.values():
-        try:
-            logger.debug(f"💾 Upserting escrow: {escrow_data['objectId']}")
-            await db.escrow.upsert(
-                where={"objectId": escrow_data["objectId"]},
-                data={
-                    "create": escrow_data,
-                    "update": {
-                        key: value for key, value in escrow_data.items() 
-                        if key != "objectId"
+    # Queue every upsert and send them as one batch, committed in a single
+    # transaction, instead of a database round trip per escrow
+    try:
+        async with db.batch_() as batcher:
+            for escrow_data in updates.values():
+                logger.debug(f"💾 Upserting escrow: {escrow_data['objectId']}")
+                batcher.escrow.upsert(
+                    where={"objectId": escrow_data["objectId"]},
+                    data={
+                        "create": escrow_data,
+                        "update": {
+                            key: value for key, value in escrow_data.items() 
+                            if key != "objectId"
+                        }
                     }
-                }
-            )
-        except Exception as e:
-            logger.error(f"Failed to upsert escrow {escrow_data['objectId']}: {e}")
-            raise
+                )
+    except Exception as e:
+        logger.error(f"Failed to upsert {len(updates)} escrow updates: {e}")
+        raise
     
     logger.info(f"✅ Successfully processed {len(updates)} escrow object updates") 
\ No newline at end of file
@@ -119,22 +119,24 @@ async def handle_lock_objects(events: List[SuiEvent], event_type: str, db: Prism
     
     logger.info(f"💾 Saving {len(updates)} lock updates to database...")
     
-    # Perform database operations using Prisma upserts
-    for lock_data in updates.values():
-        try:
-            logger.debug(f"💾 Upserting lock: {lock_data['objectId']}")
-            await db.locked.upsert(
-                where={"objectId": lock_data["objectId"]},
-                data={
-                    "create": lock_data,
-                    "update": {
-                        key: value for key, value in lock_data.items() 
-                        if key != "objectId"
+    # Queue every upsert and send them as one batch, committed in a single
+    # transaction, instead of a database round trip per lock
+    try:
+        async with db.batch_() as batcher:
+            for lock_data in updates.values():
+                logger.debug(f"💾 Upserting lock: {lock_data['objectId']}")
+                batcher.locked.upsert(
+                    where={"objectId": lock_data["objectId"]},
+                    data={
+                        "create": lock_data,
+                        "update": {
+                            key: value for key, value in lock_data.items() 
+                            if key != "objectId"
+                        }
                     }
-                }
-            )
-        except Exception as e:
-            logger.error(f"Failed to upsert lock {lock_data['objectId']}: {e}")
-            raise
+                )
+    except Exception as e:
+        logger.error(f"Failed to upsert {len(updates)} lock updates: {e}")
+        raise
     
     logger.info(f"✅ Successfully processed {len(updates)} lock object updates") 
\ No newline at end of file
@@ -107,6 +107,7 @@ class EventIndexer:
         self.db = Prisma()
         await self.db.connect()
         logger.info("Connected to database")
+        await self._tune_sqlite()
         
         # Initialize Sui client
         self.client = SuiClient(CONFIG.rpc_url)
@@ -130,6 +131,25 @@ class EventIndexer:
         
         logger.info("Event indexer stopped")
     
+    async def _tune_sqlite(self) -> None:
+        """
+        Switch the SQLite database to WAL journaling for the indexer's many small writes.
+        
+        journal_mode=WAL is stored in the database file, so it reaches every pooled
+        Prisma connection. Per-connection PRAGMAs such as synchronous, temp_store and
+        cache_size are not set here: query_raw only runs on one pooled connection and
+        Prisma's SQLite URL has no option to apply them to the others.
+        """
+        if not CONFIG.database_url.startswith("file:"):
+            return
+        
+        try:
+            # PRAGMAs may return a row, which execute_raw rejects on SQLite
+            await self.db.query_raw("PRAGMA journal_mode=WAL")
+            logger.info("Enabled SQLite WAL journal mode")
+        except Exception as e:
+            logger.warning(f"Could not enable SQLite WAL journal mode, continuing with defaults: {e}")
+    
     async def _setup_listeners(self) -> None:
         """Set up all event listeners."""
         logger.info(f"Setting up listeners for {len(self.events_to_track)} event types")
@@ -24,6 +24,8 @@ Usage:
     restored_value = U64.deserialize(deserializer)
 """
 
+import threading
+
 # Core engine
 from .serializer import Serializer
 from .deserializer import Deserializer
@@ -47,6 +49,9 @@ from .containers import (
     bcs_none
 )
 
+# Cached per-shape serializers
+from .shapes import compile_serializer, compile_deserializer
+
 # Primitive types
 from .primitives import (
     U8, U16, U32, U64, U128, U256,
@@ -94,6 +99,10 @@ __all__ = [
     "bcs_some", 
     "bcs_none",
     
+    # Shape compilation
+    "compile_serializer",
+    "compile_deserializer",
+    
     # Primitive types
     "U8", "U16", "U32", "U64", "U128", "U256",
     "Bool",
@@ -115,6 +124,16 @@ __all__ = [
 ]
 
 
+# Per-thread Serializer reused by serialize() to avoid a fresh buffer per call
+_thread_local = threading.local()
+
+# Largest per-thread serializer buffer kept for reuse between serialize() calls
+_MAX_RETAINED_CAPACITY = 64 * 1024
+
+# Primitive types that can encode themselves without a Serializer
+_DIRECT_ENCODE_TYPES = frozenset({U8, U16, U32, U64, U128, U256, Bool})
+
+
 def serialize(obj: Serializable) -> bytes:
     """
     Convenience function to serialize any BCS-serializable object.
@@ -129,9 +148,31 @@ def serialize(obj: Serializable) -> bytes:
         data = serialize(U64(42))
         vector_data = serialize(bcs_vector([U8(1), U8(2), U8(3)]))
     """
-    serializer = Serializer()
-    obj.serialize(serializer)
-    return serializer.to_bytes()
+    if type(obj) in _DIRECT_ENCODE_TYPES:
+        return obj.to_bcs()
+    
+    serializer = getattr(_thread_local, "serializer", None)
+    if serializer is None:
+        # Sized for a typical transaction, so the first one does not regrow it
+        serializer = _thread_local.serializer = Serializer(initial_capacity=1024)
+    elif _thread_local.in_use:
+        # Nested call from inside an object's serialize method; use a private
+        # buffer so the shared one is not clobbered mid-write
+        serializer = Serializer()
+        obj.serialize(serializer)
+        return serializer.to_bytes()
+    
+    _thread_local.in_use = True
+    try:
+        serializer.clear()
+        obj.serialize(serializer)
+        return serializer.to_bytes()
+    finally:
+        _thread_local.in_use = False
+        if serializer.capacity() > _MAX_RETAINED_CAPACITY:
+            # Do not keep a buffer grown by one large payload (e.g. a package
+            # publish) alive for the rest of the thread's lifetime
+            _thread_local.serializer = None
 
 
 def deserialize(data: bytes, deserializer_func):
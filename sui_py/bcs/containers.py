@@ -5,13 +5,17 @@ This module provides reusable container types that can serialize and deserialize
 collections of any BCS-serializable type, including vectors and options.
 """
 
-from typing import TypeVar, Generic, List, Optional, Type, Callable
+import array
+import builtins
+import sys
+from typing import TypeVar, Generic, List, Optional, Type, Callable, Dict
 from typing_extensions import Self
 
 from .protocols import Serializable, Deserializable
 from .serializer import Serializer
 from .deserializer import Deserializer
-from .exceptions import DeserializationError, SerializationError
+from .primitives import U8, U16, U32, U64, Bool
+from .exceptions import DeserializationError, SerializationError, InvalidDataError
 
 # Type variable for contained types
 T = TypeVar('T', bound=Serializable)
@@ -25,19 +29,64 @@ class BcsVector(Generic[T]):
     This container can hold any type that implements the Serializable protocol
     and provides BCS-compliant serialization with a length prefix followed by elements.
     
+    When constructed with an ``element_type`` of U8, U16, U32 or U64 the values are
+    stored packed in an ``array.array`` instead of as individual wrapper objects;
+    wrappers are created on demand when elements are accessed.
+    
     The serialization format is:
     - ULEB128 length
     - Elements in sequence (each element serialized according to its type)
     """
+    __slots__ = ('_elements', '_packed', '_element_type')
     
-    def __init__(self, elements: List[T]):
+    def __init__(self, elements: List[T], element_type: Optional[Type[T]] = None):
         """
         Initialize a BCS vector.
         
         Args:
             elements: List of elements to store in the vector
+            element_type: Optional element class; fixed-width integer types
+                enable packed storage and accept raw ints or bytes as elements,
+                and types defining a ``serialize_many(elements, serializer)``
+                classmethod are written in one batched call
+        """
+        self._element_type = element_type
+        self._packed = None
+        self._elements = None
+        
+        typecode = _PACKED_TYPECODES.get(element_type)
+        if typecode is None:
+            self._elements = elements
+        else:
+            self._packed = _pack_values(typecode, element_type, elements)
+    
+    @classmethod
+    def _from_packed(cls, packed: array.array, element_type: type) -> "BcsVector":
+        """Wrap an already packed array without copying it."""
+        vector = cls.__new__(cls)
+        vector._element_type = element_type
+        vector._packed = packed
+        vector._elements = None
+        return vector
+    
+    @property
+    def elements(self) -> List[T]:
+        """
+        The vector elements as a list of objects.
+        
+        Accessing this on a packed vector converts it to list storage so that
+        in-place mutation of the returned list is reflected in the vector.
         """
-        self.elements = elements
+        if self._packed is not None:
+            element_type = self._element_type
+            self._elements = [element_type(value) for value in self._packed]
+            self._packed = None
+        return self._elements
+    
+    @elements.setter
+    def elements(self, elements: List[T]) -> None:
+        self._packed = None
+        self._elements = elements
     
     def serialize(self, serializer: Serializer) -> None:
         """
@@ -50,11 +99,22 @@ class BcsVector(Generic[T]):
             SerializationError: If serialization fails
         """
         try:
+            if self._packed is not None:
+                serializer.write_vector_length(len(self._packed))
+                serializer.write_bytes(_packed_to_le_bytes(self._packed))
+                return
+            
             # Write the length as ULEB128
-            serializer.write_vector_length(len(self.elements))
+            serializer.write_vector_length(len(self._elements))
+            
+            # Element types may provide a batched writer for a whole run of values
+            serialize_many = getattr(self._element_type, 'serialize_many', None)
+            if serialize_many is not None:
+                serialize_many(self._elements, serializer)
+                return
             
             # Write each element
-            for element in self.elements:
+            for element in self._elements:
                 element.serialize(serializer)
         except Exception as e:
             raise SerializationError(f"Failed to serialize vector: {e}", "BcsVector")
@@ -97,43 +157,133 @@ class BcsVector(Generic[T]):
         except Exception as e:
             raise DeserializationError(f"Failed to deserialize vector: {e}")
     
+    @classmethod
+    def deserialize_typed(
+        cls,
+        deserializer: Deserializer,
+        element_type: Type[U]
+    ) -> "BcsVector[U]":
+        """
+        Deserialize a vector whose elements are all of a known BCS type.
+        
+        Fixed-width integer elements are read in a single pass into packed
+        storage and bool elements are validated in bulk, instead of one
+        deserializer call per element. Any other element type falls back to
+        ``element_type.deserialize``.
+        
+        Args:
+            deserializer: The BCS deserializer to read from
+            element_type: The class of the vector elements
+            
+        Returns:
+            A new BcsVector containing the deserialized elements
+            
+        Raises:
+            DeserializationError: If deserialization fails
+        """
+        typecode = _PACKED_TYPECODES.get(element_type)
+        fast_reader = _TYPED_VECTOR_READERS.get(element_type)
+        if typecode is None and fast_reader is None:
+            return cls.deserialize(deserializer, element_type.deserialize)
+        
+        try:
+            if fast_reader is not None:
+                return cls(fast_reader(deserializer))
+            
+            length = deserializer.read_vector_length()
+            packed = array.array(typecode)
+            packed.frombytes(deserializer.read_bytes(length * packed.itemsize))
+            if _BIG_ENDIAN_HOST:
+                packed.byteswap()
+            return cls._from_packed(packed, element_type)
+        except DeserializationError:
+            raise
+        except Exception as e:
+            raise DeserializationError(f"Failed to deserialize vector: {e}")
+    
+    def is_packed(self) -> bool:
+        """Check whether the elements are held in packed array storage."""
+        return self._packed is not None
+    
+    @property
+    def packed_typecode(self) -> Optional[str]:
+        """Get the array typecode of the packed storage, or None if not packed."""
+        if self._packed is None:
+            return None
+        return self._packed.typecode
+    
+    def packed_bytes(self) -> bytes:
+        """
+        Get the packed elements as concatenated little-endian bytes.
+        
+        Raises:
+            ValueError: If the vector is not held in packed storage
+        """
+        if self._packed is None:
+            raise ValueError("BcsVector is not packed")
+        return _packed_to_le_bytes(self._packed)
+    
     def __len__(self) -> int:
         """Get the number of elements in the vector."""
-        return len(self.elements)
+        if self._packed is not None:
+            return len(self._packed)
+        return len(self._elements)
     
     def __getitem__(self, index: int) -> T:
         """Get an element by index."""
-        return self.elements[index]
+        if self._packed is not None:
+            if isinstance(index, slice):
+                return [self._element_type(value) for value in self._packed[index]]
+            return self._element_type(self._packed[index])
+        return self._elements[index]
     
     def __setitem__(self, index: int, value: T) -> None:
         """Set an element by index."""
-        self.elements[index] = value
+        if self._packed is not None and isinstance(index, int):
+            self._packed[index] = _unwrap_value(self._element_type, value)
+        else:
+            self.elements[index] = value
     
     def __iter__(self):
         """Iterate over the elements."""
-        return iter(self.elements)
+        if self._packed is not None:
+            element_type = self._element_type
+            return (element_type(value) for value in self._packed)
+        return iter(self._elements)
     
     def append(self, element: T) -> None:
         """Add an element to the end of the vector."""
-        self.elements.append(element)
+        if self._packed is not None:
+            self._packed.append(_unwrap_value(self._element_type, element))
+        else:
+            self._elements.append(element)
     
     def extend(self, elements: List[T]) -> None:
         """Add multiple elements to the end of the vector."""
-        self.elements.extend(elements)
+        if self._packed is not None:
+            self._packed.extend(
+                _pack_values(self._packed.typecode, self._element_type, elements)
+            )
+        else:
+            self._elements.extend(elements)
     
     def to_list(self) -> List[T]:
         """Get the underlying list of elements."""
-        return self.elements.copy()
+        if self._packed is not None:
+            return list(self)
+        return self._elements.copy()
     
     def __eq__(self, other) -> bool:
         """Check equality with another BcsVector."""
         if not isinstance(other, BcsVector):
             return False
-        return self.elements == other.elements
+        if self._packed is not None and other._packed is not None:
+            return self._element_type is other._element_type and self._packed == other._packed
+        return self.to_list() == other.to_list()
     
     def __repr__(self) -> str:
         """String representation."""
-        return f"BcsVector({self.elements!r})"
+        return f"BcsVector({self.to_list()!r})"
 
 
 class BcsOption(Generic[T]):
@@ -147,6 +297,7 @@ class BcsOption(Generic[T]):
     - 1 byte tag: 0 for None, 1 for Some
     - If tag is 1, the value serialized according to its type
     """
+    __slots__ = ('value',)
     
     def __init__(self, value: Optional[T] = None):
         """
@@ -279,18 +430,89 @@ class BcsOption(Generic[T]):
             return f"BcsOption({self.value!r})"
 
 
+# array.array typecodes for the fixed-width integer types that support packed storage
+def _typecode_for_width(width: int) -> str:
+    """Pick the unsigned array typecode with the given item size on this platform."""
+    for typecode in ('B', 'H', 'I', 'L', 'Q'):
+        if array.array(typecode).itemsize == width:
+            return typecode
+    raise RuntimeError(f"No unsigned array typecode of width {width}")
+
+
+_PACKED_TYPECODES: Dict[type, str] = {
+    U8: _typecode_for_width(1),
+    U16: _typecode_for_width(2),
+    U32: _typecode_for_width(4),
+    U64: _typecode_for_width(8),
+}
+
+# BCS is little-endian; packed arrays are byte-swapped on big-endian hosts
+_BIG_ENDIAN_HOST = sys.byteorder == 'big'
+
+
+def _unwrap_value(element_type: type, value) -> int:
+    """Get the raw int from a wrapper instance, validating raw ints via the wrapper."""
+    if isinstance(value, element_type):
+        return value.value
+    return element_type(value).value
+
+
+def _pack_values(typecode: str, element_type: type, values) -> array.array:
+    """Pack wrapper instances, raw ints or a bytes object into an array."""
+    if typecode == 'B' and isinstance(values, (bytes, bytearray)):
+        return array.array('B', values)
+    
+    raw = [value.value if isinstance(value, element_type) else value for value in values]
+    try:
+        return array.array(typecode, raw)
+    except (builtins.OverflowError, TypeError):
+        # Re-validate through the wrapper to raise the BCS-level error
+        for value in raw:
+            element_type(value)
+        raise
+
+
+def _packed_to_le_bytes(packed: array.array) -> bytes:
+    """Get the little-endian byte representation of a packed array."""
+    if _BIG_ENDIAN_HOST and packed.itemsize > 1:
+        packed = array.array(packed.typecode, packed)
+        packed.byteswap()
+    return packed.tobytes()
+
+
+def _read_bool_vector(deserializer: Deserializer) -> list:
+    """Decode a vector of bools, validating every byte is 0 or 1."""
+    length = deserializer.read_vector_length()
+    start = deserializer.position()
+    raw = deserializer.read_bytes(length)
+    elements = []
+    for i, byte in enumerate(raw):
+        if byte > 1:
+            raise InvalidDataError("Boolean value must be 0 or 1", byte, start + i)
+        elements.append(Bool(byte == 1))
+    return elements
+
+
+# Specialized element readers for BcsVector.deserialize_typed, keyed by element class
+_TYPED_VECTOR_READERS: Dict[type, Callable[[Deserializer], list]] = {
+    Bool: _read_bool_vector,
+}
+
+
 # Convenience factory functions
-def bcs_vector(elements: List[T]) -> BcsVector[T]:
+def bcs_vector(elements: List[T], element_type: Optional[Type[T]] = None) -> BcsVector[T]:
     """
     Create a BCS vector from a list of elements.
     
     Args:
         elements: List of elements
+        element_type: Optional element class, enabling packed storage for
+            fixed-width integer types
         
     Returns:
         A new BcsVector
     """
-    return BcsVector(elements)
+    return BcsVector(elements, element_type)
 
 
 def bcs_option(value: Optional[T] = None) -> BcsOption[T]:
@@ -15,6 +15,11 @@ from .exceptions import (
     OverflowError
 )
 
+# Lookup tables mapping a raw byte to its decoded value; any byte other than
+# 0 or 1 maps to None and is rejected by the caller.
+_BOOL_LUT = (False, True) + (None,) * 254
+_OPTION_TAG_LUT = _BOOL_LUT
+
 
 class Deserializer:
     """
@@ -32,16 +37,23 @@ class Deserializer:
         """
         Initialize a new deserializer.
         
+        A memoryview (e.g. from ``Serializer.getbuffer()``) is read in place
+        without copying; the caller must not modify the underlying buffer
+        while deserializing.
+        
         Args:
-            data: The binary data to deserialize
+            data: The binary data to deserialize (bytes, bytearray or memoryview)
             
         Raises:
-            DeserializationError: If data is not bytes
+            DeserializationError: If data is not bytes, bytearray or memoryview
         """
-        if not isinstance(data, (bytes, bytearray)):
-            raise DeserializationError("Input data must be bytes or bytearray")
+        if isinstance(data, memoryview):
+            self._data = data.cast('B')
+        elif isinstance(data, (bytes, bytearray)):
+            self._data = bytes(data)  # Ensure immutable bytes
+        else:
+            raise DeserializationError("Input data must be bytes, bytearray or memoryview")
         
-        self._data = bytes(data)  # Ensure immutable bytes
         self._position = 0
         
     def _ensure_available(self, needed_bytes: int) -> None:
@@ -155,10 +167,10 @@ class Deserializer:
         """
         try:
             self._ensure_available(16)
-            # Read as two 64-bit parts (little-endian)
-            low, high = struct.unpack_from('<QQ', self._data, self._position)
+            # int.from_bytes decodes in one call instead of combining 64-bit limbs
+            value = int.from_bytes(self._data[self._position:self._position + 16], 'little')
             self._position += 16
-            return low | (high << 64)
+            return value
         except InsufficientDataError:
             raise
         except Exception as e:
@@ -177,14 +189,9 @@ class Deserializer:
         """
         try:
             self._ensure_available(32)
-            # Read as four 64-bit parts (little-endian)
-            parts = struct.unpack_from('<QQQQ', self._data, self._position)
+            value = int.from_bytes(self._data[self._position:self._position + 32], 'little')
             self._position += 32
-            
-            result = 0
-            for i, part in enumerate(parts):
-                result |= part << (64 * i)
-            return result
+            return value
         except InsufficientDataError:
             raise
         except Exception as e:
@@ -202,12 +209,10 @@ class Deserializer:
             InvalidDataError: If the byte is not 0 or 1
         """
         value = self.read_u8()
-        if value == 0:
-            return False
-        elif value == 1:
-            return True
-        else:
+        result = _BOOL_LUT[value]
+        if result is None:
             raise InvalidDataError("Boolean value must be 0 or 1", value, self._position - 1)
+        return result
     
     def read_bytes(self, length: int) -> bytes:
         """
@@ -230,7 +235,8 @@ class Deserializer:
             self._ensure_available(length)
             data = self._data[self._position:self._position + length]
             self._position += length
-            return data
+            # Copy slices of a memoryview so results outlive the source buffer
+            return data if type(data) is bytes else data.tobytes()
         except InsufficientDataError:
             raise
         except Exception as e:
@@ -250,14 +256,29 @@ class Deserializer:
             InvalidDataError: If the encoding is invalid
             OverflowError: If the value is too large
         """
+        data = self._data
+        position = self._position
+        
+        # Fast path: lengths below 128 are a single byte with no continuation bit
+        if position < len(data):
+            byte = data[position]
+            if byte < 0x80:
+                self._position = position + 1
+                return byte
+        
         result = 0
         shift = 0
         
         while True:
             if shift >= 64:  # Prevent excessive shifts
+                self._position = position
                 raise OverflowError(result, "ULEB128", (1 << 64) - 1)
             
-            byte = self.read_u8()
+            if position >= len(data):
+                self._position = position
+                raise InsufficientDataError(1, 0, position)
+            byte = data[position]
+            position += 1
             result |= (byte & 0x7F) << shift
             
             if (byte & 0x80) == 0:
@@ -265,6 +286,7 @@ class Deserializer:
             
             shift += 7
         
+        self._position = position
         return result
     
     def read_vector_length(self) -> int:
@@ -292,12 +314,10 @@ class Deserializer:
             InvalidDataError: If the tag is not 0 or 1
         """
         tag = self.read_u8()
-        if tag == 0:
-            return False
-        elif tag == 1:
-            return True
-        else:
+        result = _OPTION_TAG_LUT[tag]
+        if result is None:
             raise InvalidDataError("Option tag must be 0 or 1", tag, self._position - 1)
+        return result
     
     def remaining_bytes(self) -> int:
         """
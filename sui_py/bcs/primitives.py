@@ -5,31 +5,86 @@ This module provides wrapper classes for all Move primitive types, allowing them
 to be used in BCS serialization while maintaining type safety and validation.
 """
 
-from dataclasses import dataclass
+import struct
+from dataclasses import dataclass, fields
 from typing import Union, Any
 from typing_extensions import Self
 
 from .protocols import BcsSerializable
 from .serializer import Serializer
 from .deserializer import Deserializer
-from .exceptions import SerializationError, DeserializationError, OverflowError
+from .exceptions import (
+    SerializationError,
+    DeserializationError,
+    InsufficientDataError,
+    InvalidDataError,
+    OverflowError
+)
+
+# Maximum values of the unsigned integer types. Range checks test `value & ~max`,
+# which is non-zero both for values above the maximum and for negative values.
+_MAX_U8 = (1 << 8) - 1
+_MAX_U16 = (1 << 16) - 1
+_MAX_U32 = (1 << 32) - 1
+_MAX_U64 = (1 << 64) - 1
+_MAX_U128 = (1 << 128) - 1
+_MAX_U256 = (1 << 256) - 1
+
+# Pre-compiled little-endian layouts for the fixed-width integer fast paths
+_U16 = struct.Struct('<H')
+_U32 = struct.Struct('<I')
+_U64 = struct.Struct('<Q')
+
+
+class _SlottedValue:
+    """
+    Base for the frozen, slotted wrapper dataclasses below.
+    
+    Slots drop the per-instance __dict__; since frozen dataclasses reject the
+    setattr-based state restore that copy/pickle use for slotted objects,
+    instances are reduced to a plain constructor call instead.
+    """
+    __slots__ = ()
+    
+    def __reduce__(self):
+        cls = self.__class__
+        names = _REDUCE_FIELDS.get(cls)
+        if names is None:
+            names = _REDUCE_FIELDS[cls] = tuple(f.name for f in fields(cls))
+        return (cls, tuple(getattr(self, name) for name in names))
+
+
+# Constructor field names per wrapper class, computed on first copy/pickle
+_REDUCE_FIELDS = {}
+
+
+# Interned Bool instances, keyed by (class, value)
+_BOOL_INSTANCES = {}
+
+
+def _check_length(data: bytes, needed: int) -> None:
+    """Raise InsufficientDataError if data is shorter than needed."""
+    if len(data) < needed:
+        raise InsufficientDataError(needed, len(data), 0)
 
 
 @dataclass(frozen=True)
-class U8(BcsSerializable):
+class U8(_SlottedValue, BcsSerializable):
     """
     8-bit unsigned integer (0 to 255).
     
     Represents Move's u8 type with BCS serialization support.
     """
+    __slots__ = ('value',)
+    
     value: int
     
     def __post_init__(self):
         """Validate the value range."""
         if not isinstance(self.value, int):
             raise ValueError(f"U8 value must be an integer, got {type(self.value)}")
-        if not (0 <= self.value <= 255):
-            raise OverflowError(self.value, "u8", 255)
+        if self.value & ~_MAX_U8:
+            raise OverflowError(self.value, "u8", _MAX_U8)
     
     def serialize(self, serializer: Serializer) -> None:
         """Serialize the u8 value."""
@@ -41,26 +96,38 @@ class U8(BcsSerializable):
         value = deserializer.read_u8()
         return cls(value)
     
+    def to_bcs(self) -> bytes:
+        """Encode the u8 value directly, without a Serializer."""
+        return bytes((self.value,))
+    
+    @classmethod
+    def from_bcs(cls, data: bytes) -> Self:
+        """Decode a u8 value directly from the start of data."""
+        _check_length(data, 1)
+        return cls(data[0])
+    
     def __int__(self) -> int:
         """Convert to Python int."""
         return self.value
 
 
 @dataclass(frozen=True)
-class U16(BcsSerializable):
+class U16(_SlottedValue, BcsSerializable):
     """
     16-bit unsigned integer (0 to 65,535).
     
     Represents Move's u16 type with BCS serialization support.
     """
+    __slots__ = ('value',)
+    
     value: int
     
     def __post_init__(self):
         """Validate the value range."""
         if not isinstance(self.value, int):
             raise ValueError(f"U16 value must be an integer, got {type(self.value)}")
-        if not (0 <= self.value <= 65535):
-            raise OverflowError(self.value, "u16", 65535)
+        if self.value & ~_MAX_U16:
+            raise OverflowError(self.value, "u16", _MAX_U16)
     
     def serialize(self, serializer: Serializer) -> None:
         """Serialize the u16 value."""
@@ -72,26 +139,38 @@ class U16(BcsSerializable):
         value = deserializer.read_u16()
         return cls(value)
     
+    def to_bcs(self) -> bytes:
+        """Encode the u16 value directly, without a Serializer."""
+        return _U16.pack(self.value)
+    
+    @classmethod
+    def from_bcs(cls, data: bytes) -> Self:
+        """Decode a u16 value directly from the start of data."""
+        _check_length(data, 2)
+        return cls(_U16.unpack_from(data, 0)[0])
+    
     def __int__(self) -> int:
         """Convert to Python int."""
         return self.value
 
 
 @dataclass(frozen=True)
-class U32(BcsSerializable):
+class U32(_SlottedValue, BcsSerializable):
     """
     32-bit unsigned integer (0 to 4,294,967,295).
     
     Represents Move's u32 type with BCS serialization support.
     """
+    __slots__ = ('value',)
+    
     value: int
     
     def __post_init__(self):
         """Validate the value range."""
         if not isinstance(self.value, int):
             raise ValueError(f"U32 value must be an integer, got {type(self.value)}")
-        if not (0 <= self.value <= 4294967295):
-            raise OverflowError(self.value, "u32", 4294967295)
+        if self.value & ~_MAX_U32:
+            raise OverflowError(self.value, "u32", _MAX_U32)
     
     def serialize(self, serializer: Serializer) -> None:
         """Serialize the u32 value."""
@@ -103,26 +182,38 @@ class U32(BcsSerializable):
         value = deserializer.read_u32()
         return cls(value)
     
+    def to_bcs(self) -> bytes:
+        """Encode the u32 value directly, without a Serializer."""
+        return _U32.pack(self.value)
+    
+    @classmethod
+    def from_bcs(cls, data: bytes) -> Self:
+        """Decode a u32 value directly from the start of data."""
+        _check_length(data, 4)
+        return cls(_U32.unpack_from(data, 0)[0])
+    
     def __int__(self) -> int:
         """Convert to Python int."""
         return self.value
 
 
 @dataclass(frozen=True)
-class U64(BcsSerializable):
+class U64(_SlottedValue, BcsSerializable):
     """
     64-bit unsigned integer (0 to 18,446,744,073,709,551,615).
     
     Represents Move's u64 type with BCS serialization support.
     """
+    __slots__ = ('value',)
+    
     value: int
     
     def __post_init__(self):
         """Validate the value range."""
         if not isinstance(self.value, int):
             raise ValueError(f"U64 value must be an integer, got {type(self.value)}")
-        if not (0 <= self.value <= 18446744073709551615):
-            raise OverflowError(self.value, "u64", 18446744073709551615)
+        if self.value & ~_MAX_U64:
+            raise OverflowError(self.value, "u64", _MAX_U64)
     
     def serialize(self, serializer: Serializer) -> None:
         """Serialize the u64 value."""
@@ -134,27 +225,38 @@ class U64(BcsSerializable):
         value = deserializer.read_u64()
         return cls(value)
     
+    def to_bcs(self) -> bytes:
+        """Encode the u64 value directly, without a Serializer."""
+        return _U64.pack(self.value)
+    
+    @classmethod
+    def from_bcs(cls, data: bytes) -> Self:
+        """Decode a u64 value directly from the start of data."""
+        _check_length(data, 8)
+        return cls(_U64.unpack_from(data, 0)[0])
+    
     def __int__(self) -> int:
         """Convert to Python int."""
         return self.value
 
 
 @dataclass(frozen=True)
-class U128(BcsSerializable):
+class U128(_SlottedValue, BcsSerializable):
     """
     128-bit unsigned integer (0 to 340,282,366,920,938,463,463,374,607,431,768,211,455).
     
     Represents Move's u128 type with BCS serialization support.
     """
+    __slots__ = ('value',)
+    
     value: int
     
     def __post_init__(self):
         """Validate the value range."""
         if not isinstance(self.value, int):
             raise ValueError(f"U128 value must be an integer, got {type(self.value)}")
-        max_u128 = (1 << 128) - 1
-        if not (0 <= self.value <= max_u128):
-            raise OverflowError(self.value, "u128", max_u128)
+        if self.value & ~_MAX_U128:
+            raise OverflowError(self.value, "u128", _MAX_U128)
     
     def serialize(self, serializer: Serializer) -> None:
         """Serialize the u128 value."""
@@ -166,27 +268,38 @@ class U128(BcsSerializable):
         value = deserializer.read_u128()
         return cls(value)
     
+    def to_bcs(self) -> bytes:
+        """Encode the u128 value directly, without a Serializer."""
+        return self.value.to_bytes(16, 'little')
+    
+    @classmethod
+    def from_bcs(cls, data: bytes) -> Self:
+        """Decode a u128 value directly from the start of data."""
+        _check_length(data, 16)
+        return cls(int.from_bytes(data[:16], 'little'))
+    
     def __int__(self) -> int:
         """Convert to Python int."""
         return self.value
 
 
 @dataclass(frozen=True)
-class U256(BcsSerializable):
+class U256(_SlottedValue, BcsSerializable):
     """
     256-bit unsigned integer.
     
     Represents Move's u256 type with BCS serialization support.
     """
+    __slots__ = ('value',)
+    
     value: int
     
     def __post_init__(self):
         """Validate the value range."""
         if not isinstance(self.value, int):
             raise ValueError(f"U256 value must be an integer, got {type(self.value)}")
-        max_u256 = (1 << 256) - 1
-        if not (0 <= self.value <= max_u256):
-            raise OverflowError(self.value, "u256", max_u256)
+        if self.value & ~_MAX_U256:
+            raise OverflowError(self.value, "u256", _MAX_U256)
     
     def serialize(self, serializer: Serializer) -> None:
         """Serialize the u256 value."""
@@ -198,20 +311,45 @@ class U256(BcsSerializable):
         value = deserializer.read_u256()
         return cls(value)
     
+    def to_bcs(self) -> bytes:
+        """Encode the u256 value directly, without a Serializer."""
+        return self.value.to_bytes(32, 'little')
+    
+    @classmethod
+    def from_bcs(cls, data: bytes) -> Self:
+        """Decode a u256 value directly from the start of data."""
+        _check_length(data, 32)
+        return cls(int.from_bytes(data[:32], 'little'))
+    
     def __int__(self) -> int:
         """Convert to Python int."""
         return self.value
 
 
 @dataclass(frozen=True)
-class Bool(BcsSerializable):
+class Bool(_SlottedValue, BcsSerializable):
     """
     Boolean value (true or false).
     
     Represents Move's bool type with BCS serialization support.
+    
+    Only two values exist, so ``Bool(True)`` and ``Bool(False)`` always return
+    the shared ``Bool.TRUE`` / ``Bool.FALSE`` instances.
     """
+    __slots__ = ('value',)
+    
     value: bool
     
+    def __new__(cls, value: bool):
+        """Return the interned instance for True/False."""
+        if type(value) is not bool:
+            # Leave invalid values to __post_init__ without touching the cache
+            return super().__new__(cls)
+        instance = _BOOL_INSTANCES.get((cls, value))
+        if instance is None:
+            instance = _BOOL_INSTANCES[(cls, value)] = super().__new__(cls)
+        return instance
+    
     def __post_init__(self):
         """Validate the value type."""
         if not isinstance(self.value, bool):
@@ -227,26 +365,47 @@ class Bool(BcsSerializable):
         value = deserializer.read_bool()
         return cls(value)
     
+    def to_bcs(self) -> bytes:
+        """Encode the boolean value directly, without a Serializer."""
+        return b'\x01' if self.value else b'\x00'
+    
+    @classmethod
+    def from_bcs(cls, data: bytes) -> Self:
+        """Decode a boolean value directly from the start of data."""
+        _check_length(data, 1)
+        byte = data[0]
+        if byte > 1:
+            raise InvalidDataError("Boolean value must be 0 or 1", byte, 0)
+        return cls(byte == 1)
+    
     def __bool__(self) -> bool:
         """Convert to Python bool."""
         return self.value
 
 
+Bool.TRUE = Bool(True)
+Bool.FALSE = Bool(False)
+
+
 @dataclass(frozen=True)
-class Bytes(BcsSerializable):
+class Bytes(_SlottedValue, BcsSerializable):
     """
     Raw byte sequence with length prefix.
     
     This represents a vector<u8> in Move, which is commonly used
     for arbitrary binary data.
     """
+    __slots__ = ('value',)
+    
     value: bytes
     
     def __post_init__(self):
         """Validate the value type."""
-        if not isinstance(self.value, (bytes, bytearray)):
-            raise ValueError(f"Bytes value must be bytes or bytearray, got {type(self.value)}")
-        # Ensure immutable bytes
+        if type(self.value) is bytes:
+            return
+        if not isinstance(self.value, (bytes, bytearray, memoryview)):
+            raise ValueError(f"Bytes value must be bytes, bytearray or memoryview, got {type(self.value)}")
+        # Ensure immutable bytes; bytes input is stored as-is without a copy
         object.__setattr__(self, 'value', bytes(self.value))
     
     def serialize(self, serializer: Serializer) -> None:
@@ -271,23 +430,28 @@ class Bytes(BcsSerializable):
 
 
 @dataclass(frozen=True)
-class FixedBytes(BcsSerializable):
+class FixedBytes(_SlottedValue, BcsSerializable):
     """
     Fixed-length byte sequence without length prefix.
     
     This is used for types like addresses, hashes, and other
     fixed-size binary data where the length is known from context.
     """
+    __slots__ = ('value', 'expected_length')
+    
     value: bytes
     expected_length: int
     
     def __post_init__(self):
         """Validate the value type and length."""
-        if not isinstance(self.value, (bytes, bytearray)):
-            raise ValueError(f"FixedBytes value must be bytes or bytearray, got {type(self.value)}")
-        
-        # Ensure immutable bytes
-        object.__setattr__(self, 'value', bytes(self.value))
+        if type(self.value) is not bytes:
+            if not isinstance(self.value, (bytes, bytearray, memoryview)):
+                raise ValueError(
+                    f"FixedBytes value must be bytes, bytearray or memoryview, got {type(self.value)}"
+                )
+            
+            # Ensure immutable bytes; bytes input is stored as-is without a copy
+            object.__setattr__(self, 'value', bytes(self.value))
         
         if len(self.value) != self.expected_length:
             raise ValueError(
@@ -364,8 +528,8 @@ def boolean(value: Union[bool, Bool]) -> Bool:
     return Bool(value)
 
 
-def bytes_value(value: Union[bytes, bytearray, Bytes]) -> Bytes:
-    """Create a Bytes from bytes/bytearray or existing Bytes."""
+def bytes_value(value: Union[bytes, bytearray, memoryview, Bytes]) -> Bytes:
+    """Create a Bytes from bytes/bytearray/memoryview or existing Bytes."""
     if isinstance(value, Bytes):
         return value
     return Bytes(value)
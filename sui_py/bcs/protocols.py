@@ -28,6 +28,7 @@ class Serializable(Protocol):
             def serialize(self, serializer: Serializer) -> None:
                 serializer.write_bytes(self._address_bytes)
     """
+    __slots__ = ()
     
     def serialize(self, serializer: "Serializer") -> None:
         """
@@ -61,6 +62,7 @@ class Deserializable(Protocol):
                 address_bytes = deserializer.read_bytes(32)
                 return cls(address_bytes)
     """
+    __slots__ = ()
     
     @classmethod
     def deserialize(cls, deserializer: "Deserializer") -> Self:
@@ -95,7 +97,7 @@ class BcsSerializable(Serializable, Deserializable, Protocol):
     This is a convenience protocol for types that implement both directions of BCS
     conversion. Most concrete types should implement this combined protocol.
     """
-    pass
+    __slots__ = ()
 
 
 class SizedSerializable(Serializable, Protocol):
@@ -105,6 +107,7 @@ class SizedSerializable(Serializable, Protocol):
     This is useful for optimizing buffer allocation in the serializer,
     especially for types with known or easily calculated sizes.
     """
+    __slots__ = ()
     
     def serialized_size(self) -> int:
         """
@@ -123,6 +126,7 @@ class VersionedDeserializable(Deserializable, Protocol):
     This allows for schema evolution and backward compatibility by including
     version information in the deserialization process.
     """
+    __slots__ = ()
     
     @classmethod
     def deserialize_versioned(cls, deserializer: "Deserializer", version: int) -> Self:
@@ -10,6 +10,10 @@ from typing import Optional
 
 from .exceptions import SerializationError, OverflowError
 
+# Upper bounds for the wide integers, built once rather than on every write
+_MAX_U128 = (1 << 128) - 1
+_MAX_U256 = (1 << 256) - 1
+
 
 class Serializer:
     """
@@ -141,16 +145,14 @@ class Serializer:
             OverflowError: If value exceeds u128 range
             SerializationError: If writing fails
         """
-        max_u128 = (1 << 128) - 1
-        if not (0 <= value <= max_u128):
-            raise OverflowError(value, "u128", max_u128)
+        if not (0 <= value <= _MAX_U128):
+            raise OverflowError(value, "u128", _MAX_U128)
         
         try:
             self._ensure_capacity(16)
-            # Split into two 64-bit parts (little-endian)
-            low = value & 0xFFFFFFFFFFFFFFFF
-            high = (value >> 64) & 0xFFFFFFFFFFFFFFFF
-            struct.pack_into('<QQ', self._buffer, self._position, low, high)
+            # int.to_bytes encodes straight from the int's internal digits,
+            # avoiding the shifts and masks needed to split into 64-bit limbs
+            self._buffer[self._position:self._position + 16] = value.to_bytes(16, 'little')
             self._position += 16
         except Exception as e:
             raise SerializationError(f"Failed to write u128: {e}")
@@ -166,17 +168,12 @@ class Serializer:
             OverflowError: If value exceeds u256 range
             SerializationError: If writing fails
         """
-        max_u256 = (1 << 256) - 1
-        if not (0 <= value <= max_u256):
-            raise OverflowError(value, "u256", max_u256)
+        if not (0 <= value <= _MAX_U256):
+            raise OverflowError(value, "u256", _MAX_U256)
         
         try:
             self._ensure_capacity(32)
-            # Split into four 64-bit parts (little-endian)
-            parts = []
-            for i in range(4):
-                parts.append((value >> (64 * i)) & 0xFFFFFFFFFFFFFFFF)
-            struct.pack_into('<QQQQ', self._buffer, self._position, *parts)
+            self._buffer[self._position:self._position + 32] = value.to_bytes(32, 'little')
             self._position += 32
         except Exception as e:
             raise SerializationError(f"Failed to write u256: {e}")
@@ -198,15 +195,17 @@ class Serializer:
         Write raw bytes without length prefix.
         
         Args:
-            data: Bytes to write
+            data: Bytes to write (bytes, bytearray or memoryview; copied once into the buffer)
             
         Raises:
             SerializationError: If writing fails
         """
-        if not isinstance(data, (bytes, bytearray)):
-            raise SerializationError("Data must be bytes or bytearray")
+        if not isinstance(data, (bytes, bytearray, memoryview)):
+            raise SerializationError("Data must be bytes, bytearray or memoryview")
         
         try:
+            if isinstance(data, memoryview):
+                data = data.cast('B')
             data_len = len(data)
             self._ensure_capacity(data_len)
             self._buffer[self._position:self._position + data_len] = data
@@ -230,10 +229,23 @@ class Serializer:
             raise SerializationError(f"ULEB128 value must be non-negative, got {value}")
         
         try:
-            while value >= 128:
-                self.write_u8((value & 0x7F) | 0x80)
+            # Lengths and tags almost always fit in one byte
+            if value < 0x80:
+                self._ensure_capacity(1)
+                self._buffer[self._position] = value
+                self._position += 1
+                return
+            
+            # Encode into a scratch buffer, then copy with a single capacity check
+            encoded = bytearray()
+            while value >= 0x80:
+                encoded.append((value & 0x7F) | 0x80)
                 value >>= 7
-            self.write_u8(value & 0x7F)
+            encoded.append(value)
+            size = len(encoded)
+            self._ensure_capacity(size)
+            self._buffer[self._position:self._position + size] = encoded
+            self._position += size
         except Exception as e:
             raise SerializationError(f"Failed to write ULEB128: {e}")
     
@@ -267,7 +279,21 @@ class Serializer:
         Returns:
             The serialized data as a bytes object
         """
-        return bytes(self._buffer[:self._position])
+        # Slicing a view copies once; slicing the bytearray would copy twice
+        return memoryview(self._buffer)[:self._position].tobytes()
+    
+    def getbuffer(self) -> memoryview:
+        """
+        Get a read-only view of the serialized data without copying it.
+        
+        The view aliases the internal buffer, so it reflects later writes and
+        blocks the buffer from growing while it is alive. Release it (or let it
+        go out of scope) before writing more data.
+        
+        Returns:
+            A memoryview over the bytes written so far
+        """
+        return memoryview(self._buffer)[:self._position].toreadonly()
     
     def clear(self) -> None:
         """
@@ -277,6 +303,15 @@ class Serializer:
         """
         self._position = 0
     
+    def capacity(self) -> int:
+        """
+        Get the number of bytes allocated for the internal buffer.
+        
+        Returns:
+            The buffer size, which is at least the size of the serialized data
+        """
+        return len(self._buffer)
+    
     def size(self) -> int:
         """
         Get the current size of serialized data.
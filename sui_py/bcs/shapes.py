@@ -0,0 +1,166 @@
+"""
+Cached per-shape serializers for BCS container layouts.
+
+A shape describes the layout of a value so that a specialized serialize or
+deserialize function can be built once and reused:
+
+- A BCS type class (``U8``, ``U64``, ``Bool``, ``Bytes``, or any class with
+  ``serialize``/``deserialize``) describes a single value of that type
+- ``("vector", shape)`` describes a ``BcsVector`` of that shape
+- ``("option", shape)`` describes a ``BcsOption`` of that shape
+
+Usage:
+    from sui_py.bcs import compile_serializer, compile_deserializer, Serializer, U32
+
+    write = compile_serializer(("vector", ("option", U32)))
+    serializer = Serializer()
+    write(vector, serializer)
+
+    read = compile_deserializer(("vector", ("option", U32)))
+    restored = read(Deserializer(serializer.to_bytes()))
+
+The compiled functions write primitive elements directly through the matching
+``Serializer.write_*`` method, skipping the per-element ``serialize`` dispatch
+and error wrapping done by the generic containers.
+"""
+
+from functools import lru_cache
+from typing import Any, Callable, Tuple, Union
+
+from .serializer import Serializer
+from .deserializer import Deserializer
+from .containers import BcsVector, BcsOption, _PACKED_TYPECODES
+from .primitives import U8, U16, U32, U64, U128, U256, Bool, Bytes
+from .exceptions import SerializationError, DeserializationError
+
+Shape = Union[type, Tuple[str, Any]]
+
+# Serializer methods used to write the raw value of each primitive wrapper
+_PRIMITIVE_WRITERS = {
+    U8: Serializer.write_u8,
+    U16: Serializer.write_u16,
+    U32: Serializer.write_u32,
+    U64: Serializer.write_u64,
+    U128: Serializer.write_u128,
+    U256: Serializer.write_u256,
+    Bool: Serializer.write_bool,
+}
+
+
+def _validate_shape(shape: Shape) -> None:
+    """Raise ValueError if shape is not a type or a (kind, inner) tuple."""
+    if isinstance(shape, tuple):
+        if len(shape) != 2 or shape[0] not in ("vector", "option"):
+            raise ValueError(f"Unsupported shape: {shape!r}")
+    elif not isinstance(shape, type):
+        raise ValueError(f"Unsupported shape: {shape!r}")
+
+
+@lru_cache(maxsize=None)
+def compile_serializer(shape: Shape) -> Callable[[Any, Serializer], None]:
+    """
+    Build (and cache) a serialize function for a value of the given shape.
+
+    Args:
+        shape: The shape of the values to serialize
+
+    Returns:
+        A function ``write(value, serializer)``
+
+    Raises:
+        ValueError: If the shape is not supported
+    """
+    _validate_shape(shape)
+
+    if not isinstance(shape, tuple):
+        write_raw = _PRIMITIVE_WRITERS.get(shape)
+        if write_raw is not None:
+            return lambda value, serializer: write_raw(serializer, value.value)
+        if shape is Bytes:
+            def write_bytes(value: Bytes, serializer: Serializer) -> None:
+                serializer.write_vector_length(len(value.value))
+                serializer.write_bytes(value.value)
+            return write_bytes
+        return lambda value, serializer: value.serialize(serializer)
+
+    kind, inner = shape
+    write_inner = compile_serializer(inner)
+
+    if kind == "option":
+        def write_option(option: BcsOption, serializer: Serializer) -> None:
+            if option.value is None:
+                serializer.write_option_tag(False)
+            else:
+                serializer.write_option_tag(True)
+                write_inner(option.value, serializer)
+        return write_option
+
+    packed_typecode = _PACKED_TYPECODES.get(inner)
+
+    def write_vector(vector: BcsVector, serializer: Serializer) -> None:
+        try:
+            if vector.is_packed():
+                if vector.packed_typecode != packed_typecode:
+                    raise SerializationError(
+                        f"Packed vector of typecode {vector.packed_typecode!r} "
+                        f"does not match element shape {inner!r}",
+                        "BcsVector"
+                    )
+                serializer.write_vector_length(len(vector))
+                serializer.write_bytes(vector.packed_bytes())
+                return
+            elements = vector.elements
+            serializer.write_vector_length(len(elements))
+            for element in elements:
+                write_inner(element, serializer)
+        except SerializationError:
+            raise
+        except Exception as e:
+            raise SerializationError(f"Failed to serialize vector: {e}", "BcsVector")
+    return write_vector
+
+
+@lru_cache(maxsize=None)
+def compile_deserializer(shape: Shape) -> Callable[[Deserializer], Any]:
+    """
+    Build (and cache) a deserialize function for a value of the given shape.
+
+    Args:
+        shape: The shape of the values to deserialize
+
+    Returns:
+        A function ``read(deserializer)`` returning the decoded value
+
+    Raises:
+        ValueError: If the shape is not supported
+    """
+    _validate_shape(shape)
+
+    if not isinstance(shape, tuple):
+        return shape.deserialize
+
+    kind, inner = shape
+
+    if kind == "option":
+        read_inner = compile_deserializer(inner)
+
+        def read_option(deserializer: Deserializer) -> BcsOption:
+            if deserializer.read_option_tag():
+                return BcsOption(read_inner(deserializer))
+            return BcsOption(None)
+        return read_option
+
+    if inner is Bool or inner in _PACKED_TYPECODES:
+        return lambda deserializer: BcsVector.deserialize_typed(deserializer, inner)
+
+    read_inner = compile_deserializer(inner)
+
+    def read_vector(deserializer: Deserializer) -> BcsVector:
+        length = deserializer.read_vector_length()
+        try:
+            return BcsVector([read_inner(deserializer) for _ in range(length)])
+        except DeserializationError:
+            raise
+        except Exception as e:
+            raise DeserializationError(f"Failed to deserialize vector: {e}")
+    return read_vector
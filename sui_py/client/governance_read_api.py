@@ -5,7 +5,7 @@ Implements all governance-related read RPC methods from the Sui JSON-RPC API.
 These methods provide access to validator information, system state, and staking data.
 """
 
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, Iterable, List, Optional, Union
 
 from .rest_client import RestClient
 from ..exceptions import SuiValidationError
@@ -13,6 +13,7 @@ from ..types import (
     CommitteeInfo, DelegatedStake, ValidatorApys, SuiSystemStateSummary, 
     SuiValidatorSummary, StakeObject, SuiAddress, ObjectID, Page
 )
+from ..types.base import _is_hex
 
 
 class GovernanceReadClient:
@@ -53,17 +54,40 @@ class GovernanceReadClient:
         if not isinstance(address, str):
             raise SuiValidationError("Address must be a string or SuiAddress")
         
-        # Basic validation for Sui address format (0x prefix and hex)
-        if not address.startswith('0x') or len(address) < 3:
-            raise SuiValidationError("Invalid Sui address format")
-        
-        try:
-            # Check if the hex part is valid
-            int(address[2:], 16)
-        except ValueError:
+        # Basic validation for Sui address format (0x prefix and up to 64 hex digits)
+        if not (address.startswith('0x') and 2 < len(address) <= 66
+                and _is_hex(address[2:])):
             raise SuiValidationError("Invalid Sui address format")
         
         return address
+    
+    @staticmethod
+    def _validate_object_ids(object_ids: Iterable[Union[str, ObjectID]]) -> List[str]:
+        """
+        Validate and normalize a sequence of object IDs in a single pass.
+        
+        Args:
+            object_ids: Object ID strings or ObjectID instances
+            
+        Returns:
+            The object IDs as strings, in input order
+            
+        Raises:
+            SuiValidationError: If any object ID is of the wrong type or format
+        """
+        ids = []
+        append = ids.append
+        is_hex = _is_hex
+        for obj_id in object_ids:
+            if isinstance(obj_id, ObjectID):
+                append(obj_id.value)
+            elif not isinstance(obj_id, str):
+                raise SuiValidationError("Object ID must be a string or ObjectID")
+            elif obj_id.startswith('0x') and 2 < len(obj_id) <= 66 and is_hex(obj_id[2:]):
+                append(obj_id)
+            else:
+                raise SuiValidationError(f"Invalid object ID format: {obj_id}")
+        return ids
 
     async def get_committee_info(self, epoch: Optional[str] = None) -> CommitteeInfo:
         """
@@ -195,10 +219,10 @@ class GovernanceReadClient:
             List of DelegatedStake objects
             
         Raises:
+            SuiValidationError: If any staked SUI ID is invalid
             SuiRpcError: If the RPC call fails
         """
-        # Convert ObjectID objects to strings if needed
-        ids = [str(obj_id) for obj_id in staked_sui_ids]
+        ids = self._validate_object_ids(staked_sui_ids)
         
         response = await self.rest_client.call("suix_getStakesByIds", [ids])
         
@@ -4,8 +4,8 @@ Ed25519 private key implementation using PyNaCl.
 
 import base64
 import secrets
-from dataclasses import dataclass
-from typing import TYPE_CHECKING
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Optional
 
 import nacl.signing
 import nacl.encoding
@@ -29,6 +29,7 @@ class PrivateKey(AbstractPrivateKey):
     key generation, signing, and serialization operations.
     """
     _key: nacl.signing.SigningKey
+    _public_key: Optional[PublicKey] = field(default=None, init=False, repr=False, compare=False)
     
     def __post_init__(self):
         """Validate the private key on creation."""
@@ -137,11 +138,16 @@ class PrivateKey(AbstractPrivateKey):
         """
         Get the corresponding Ed25519 public key.
         
+        The key is derived on first use and cached, since the private key
+        is immutable.
+        
         Returns:
             The Ed25519 public key derived from this private key
         """
-        verify_key = self._key.verify_key
-        return PublicKey(verify_key)
+        if self._public_key is None:
+            # Update the cache using object.__setattr__ since the dataclass is frozen
+            object.__setattr__(self, '_public_key', PublicKey(self._key.verify_key))
+        return self._public_key
     
     def sign(self, message: bytes) -> Signature:
         """
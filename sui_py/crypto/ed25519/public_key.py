@@ -4,8 +4,8 @@ Ed25519 public key implementation using PyNaCl.
 
 import base64
 import hashlib
-from dataclasses import dataclass
-from typing import TYPE_CHECKING
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Optional, Sequence
 
 import nacl.signing
 import nacl.encoding
@@ -29,6 +29,7 @@ class PublicKey(AbstractPublicKey):
     signature verification and Sui address derivation.
     """
     _key: nacl.signing.VerifyKey
+    _sui_address: Optional[SuiAddress] = field(default=None, init=False, repr=False, compare=False)
     
     def __post_init__(self):
         """Validate the public key on creation."""
@@ -154,6 +155,44 @@ class PublicKey(AbstractPublicKey):
             # Any exception means verification failed
             return False
     
+    @classmethod
+    def verify_batch(
+        cls,
+        public_keys: Sequence["PublicKey"],
+        messages: Sequence[bytes],
+        signatures: Sequence[Signature]
+    ) -> bool:
+        """
+        Verify several signatures, each against its own key and message.
+        
+        This is a convenience loop over ``verify``, not amortized batch
+        verification: libsodium exposes no Ed25519 batch entry point, so it is
+        no faster than verifying each signature separately. It stops at the
+        first invalid signature.
+        
+        Args:
+            public_keys: The public key for each signature
+            messages: The original message bytes for each signature
+            signatures: The signatures to verify
+            
+        Returns:
+            True if every signature is valid, False otherwise
+            
+        Raises:
+            SuiValidationError: If the sequences differ in length or inputs are invalid
+        """
+        if not (len(public_keys) == len(messages) == len(signatures)):
+            raise SuiValidationError(
+                "public_keys, messages and signatures must have the same length"
+            )
+        
+        for public_key, message, signature in zip(public_keys, messages, signatures):
+            if not isinstance(public_key, cls):
+                raise SuiValidationError("Public keys must be Ed25519 public keys")
+            if not public_key.verify(message, signature):
+                return False
+        return True
+    
     def to_sui_bytes(self) -> bytes:
         """
         Return the Sui representation of the public key.
@@ -189,9 +228,14 @@ class PublicKey(AbstractPublicKey):
         2. Hash with BLAKE2b-256 (32 bytes output)
         3. Convert to hex with 0x prefix
         
+        The address is derived on first use and cached on the key.
+        
         Returns:
             The Sui address
         """
+        if self._sui_address is not None:
+            return self._sui_address
+        
         try:
             # Get the Sui bytes (flag + public key, 33 bytes total)
             sui_bytes = self.to_sui_bytes()
@@ -202,9 +246,13 @@ class PublicKey(AbstractPublicKey):
             # Convert to hex with 0x prefix
             address_hex = "0x" + address_bytes.hex()
             
-            return SuiAddress.from_str(address_hex)
+            address = SuiAddress.from_str(address_hex)
         except Exception as e:
             raise SuiValidationError(f"Failed to derive Sui address: {e}")
+        
+        # Update the cache using object.__setattr__ since the dataclass is frozen
+        object.__setattr__(self, '_sui_address', address)
+        return address
     
     def to_bytes(self) -> bytes:
         """
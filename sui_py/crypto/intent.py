@@ -190,7 +190,8 @@ class IntentMessage(BcsSerializable, Generic[T]):
     
     def to_bytes(self) -> bytes:
         """Get the complete serialized intent message."""
-        serializer = Serializer()
+        # The size is known up front: 3 intent bytes plus the raw value
+        serializer = Serializer(initial_capacity=3 + len(self.value))
         self.serialize(serializer)
         return serializer.to_bytes()
 
@@ -266,8 +267,9 @@ def message_with_intent_for_personal_message(message: bytes) -> bytes:
         raise SuiValidationError(f"message must be bytes, got {type(message)}")
     
     # Serialize message as vector<u8> (BCS format: length prefix + bytes)
-    message_vector = bcs_vector([U8(b) for b in message])
-    serializer = Serializer()
+    message_vector = bcs_vector(message, element_type=U8)
+    # A ULEB128 length prefix takes at most 5 bytes for any realistic message
+    serializer = Serializer(initial_capacity=len(message) + 5)
     message_vector.serialize(serializer)
     message_bytes = serializer.to_bytes()
     
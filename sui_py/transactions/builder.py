@@ -101,12 +101,28 @@ class TransactionBuilder:
                              reject valid but unusual transactions. If False (default),
                              follows the permissive validation approach of the TypeScript SDK.
         """
+        self._strict_validation = strict_validation
+        self.reset()
+        
+        # Set up logger for this builder instance
+        self._logger = get_logger("sui_py.transactions.builder")
+    
+    def reset(self) -> 'TransactionBuilder':
+        """
+        Discard all inputs, commands and transaction metadata.
+        
+        The validation mode and logger are kept, so one builder can be reused
+        for several transactions. PTBs and transaction data built earlier are
+        unaffected because build copies the builder's lists.
+        
+        Returns:
+            Self for method chaining
+        """
         self._inputs: List[PTBInputArgument] = []  # Only PureArgument and ObjectArgument
         self._commands: List[AnyCommand] = [] # List of Commands to be executed in the PTB
         self._input_cache: Dict[Any, int] = {}  # For deduplication
         self._gas_coin_used = False
         self._unresolved_objects: List[Tuple[int, str]] = []  # (input_index, object_id) for resolution
-        self._strict_validation = strict_validation
         
         # Transaction metadata
         self._sender: Optional[SuiAddress] = None
@@ -115,9 +131,7 @@ class TransactionBuilder:
         self._gas_payment: Optional[List[ObjectRef]] = None
         self._gas_owner: Optional[SuiAddress] = None
         self._expiration: Optional[TransactionExpiration] = None
-        
-        # Set up logger for this builder instance
-        self._logger = get_logger("sui_py.transactions.builder")
+        return self
     
     @classmethod
     def new_strict(cls) -> 'TransactionBuilder':
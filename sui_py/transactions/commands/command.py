@@ -19,11 +19,6 @@ from .publish import Publish
 from .upgrade import Upgrade
 from .make_move_vec import MakeMoveVec
 
-from ...utils.logging import setup_logging, get_logger
-import logging
-
-setup_logging(level=logging.DEBUG, use_emojis=True)
-logger = get_logger("sui_py.transactions.commands.command.Command")
 
 class CommandKind(IntEnum):
     """
@@ -64,60 +59,29 @@ class Command(BcsSerializable):
     
     def serialize(self, serializer: Serializer) -> None:
         """Serialize with enum tag followed by command data."""
-        if isinstance(self.data, MoveCall):
-            logger.debug(f"Serializing MoveCall Command: {self.data}")
-            serializer.write_u8(CommandKind.MoveCall)
-            self.data.serialize(serializer)
-        elif isinstance(self.data, TransferObjects):
-            logger.debug(f"Serializing TransferObjects Command: {self.data}")
-            serializer.write_u8(CommandKind.TransferObjects)
-            self.data.serialize(serializer)
-        elif isinstance(self.data, SplitCoins):
-            logger.debug(f"Serializing SplitCoins Command: {self.data}")
-            serializer.write_u8(CommandKind.SplitCoins)
-            self.data.serialize(serializer)
-        elif isinstance(self.data, MergeCoins):
-            logger.debug(f"Serializing MergeCoins Command: {self.data}")
-            serializer.write_u8(CommandKind.MergeCoins)
-            self.data.serialize(serializer)
-        elif isinstance(self.data, Publish):
-            logger.debug(f"Serializing Publish Command: {self.data}")
-            serializer.write_u8(CommandKind.Publish)
-            self.data.serialize(serializer)
-        elif isinstance(self.data, Upgrade):
-            logger.debug(f"Serializing Upgrade Command: {self.data}")
-            serializer.write_u8(CommandKind.Upgrade)
-            self.data.serialize(serializer)
-        elif isinstance(self.data, MakeMoveVec):
-            logger.debug(f"Serializing MakeMoveVec Command: {self.data}")
-            serializer.write_u8(CommandKind.MakeMoveVec)
-            self.data.serialize(serializer)
-        else:
-            raise ValueError(f"Unknown command type: {type(self.data)}")
+        kind = _COMMAND_KINDS.get(type(self.data))
+        if kind is None:
+            # Subclasses of the command types miss the exact-type lookup
+            kind = next(
+                (k for t, k in _COMMAND_KINDS.items() if isinstance(self.data, t)),
+                None
+            )
+            if kind is None:
+                raise ValueError(f"Unknown command type: {type(self.data)}")
+        
+        serializer.write_u8(kind)
+        self.data.serialize(serializer)
     
     @classmethod
     def deserialize(cls, deserializer: Deserializer) -> Self:
         """Deserialize from BCS bytes - handles all command types internally."""
         tag = deserializer.read_u8()
         
-        if tag == CommandKind.MoveCall:
-            data = MoveCall.deserialize(deserializer)
-        elif tag == CommandKind.TransferObjects:
-            data = TransferObjects.deserialize(deserializer)
-        elif tag == CommandKind.SplitCoins:
-            data = SplitCoins.deserialize(deserializer)
-        elif tag == CommandKind.MergeCoins:
-            data = MergeCoins.deserialize(deserializer)
-        elif tag == CommandKind.Publish:
-            data = Publish.deserialize(deserializer)
-        elif tag == CommandKind.Upgrade:
-            data = Upgrade.deserialize(deserializer)
-        elif tag == CommandKind.MakeMoveVec:
-            data = MakeMoveVec.deserialize(deserializer)
-        else:
+        command_type = _COMMAND_TYPES.get(tag)
+        if command_type is None:
             raise ValueError(f"Unknown command tag: {tag}")
         
-        return cls(data=data)
+        return cls(data=command_type.deserialize(deserializer))
     
     @classmethod
     def move_call(cls, package: str, module: str, function: str, 
@@ -177,5 +141,18 @@ class Command(BcsSerializable):
         return cls(data=make_vec)
 
 
+# Command data type <-> enum tag, so (de)serialization is one dict lookup
+_COMMAND_KINDS = {
+    MoveCall: CommandKind.MoveCall,
+    TransferObjects: CommandKind.TransferObjects,
+    SplitCoins: CommandKind.SplitCoins,
+    MergeCoins: CommandKind.MergeCoins,
+    Publish: CommandKind.Publish,
+    Upgrade: CommandKind.Upgrade,
+    MakeMoveVec: CommandKind.MakeMoveVec,
+}
+_COMMAND_TYPES = {kind: command_type for command_type, kind in _COMMAND_KINDS.items()}
+
+
 # Type alias for backward compatibility
 AnyCommand = Command 
\ No newline at end of file
@@ -9,11 +9,11 @@ from dataclasses import dataclass
 from typing import List
 from typing_extensions import Self
 
-from ...bcs import BcsSerializable, Serializer, Deserializer, BcsVector, bcs_vector
+from ...bcs import BcsSerializable, Serializer, Deserializer, BcsVector, SerializationError
 from ...types import ObjectID
 from ...types.type_tag import parse_type_tag, deserialize_type_tag
 from ..arguments import TransactionArgument, deserialize_transaction_argument
-from ..utils import BcsString, parse_move_call_target, validate_object_id
+from ..utils import BcsString, encode_identifier, parse_move_call_target, validate_object_id
 
 
 @dataclass
@@ -45,22 +45,35 @@ class MoveCall(BcsSerializable):
         4. Type arguments as vector of TypeTags
         5. Arguments as vector of TransactionArguments
         """
+        # The layout is fixed, so fields are written straight into the
+        # serializer without BcsVector wrappers; the vector error wrapping
+        # matches BcsVector.serialize
+        write_length = serializer.write_vector_length
+        write_bytes = serializer.write_bytes
+        
         # Serialize package ID (32 bytes without length prefix)
         validate_object_id(self.package)
-        serializer.write_bytes(bytes.fromhex(self.package[2:]))  # Remove 0x prefix
-        
-        # Serialize module name
-        BcsString(self.module).serialize(serializer)
+        write_bytes(bytes.fromhex(self.package[2:]))  # Remove 0x prefix
         
-        # Serialize function name  
-        BcsString(self.function).serialize(serializer)
+        # Serialize module and function names as length-prefixed UTF-8
+        write_bytes(encode_identifier(self.module))
+        write_bytes(encode_identifier(self.function))
         
-        # Serialize type arguments
+        # Parse first so a bad type string raises before anything is written
         type_tags = [parse_type_tag(type_arg) for type_arg in self.type_arguments]
-        bcs_vector(type_tags).serialize(serializer)
         
-        # Serialize arguments
-        bcs_vector(self.arguments).serialize(serializer)
+        try:
+            # Serialize type arguments as a vector of TypeTags
+            write_length(len(type_tags))
+            for type_tag in type_tags:
+                type_tag.serialize(serializer)
+            
+            # Serialize arguments
+            write_length(len(self.arguments))
+            for argument in self.arguments:
+                argument.serialize(serializer)
+        except Exception as e:
+            raise SerializationError(f"Failed to serialize vector: {e}", "BcsVector")
     
     @classmethod
     def deserialize(cls, deserializer: Deserializer) -> Self:
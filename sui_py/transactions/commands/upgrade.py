@@ -56,7 +56,7 @@ class Upgrade(BcsSerializable):
         # Serialize modules as vector of byte vectors
         modules_data = []
         for module in self.modules:
-            module_vector = bcs_vector([U8(b) for b in module])
+            module_vector = bcs_vector(module, element_type=U8)
             modules_data.append(module_vector)
         
         modules_vector = bcs_vector(modules_data)
@@ -7,16 +7,11 @@ from ...bcs import Serializer, Deserializer, Serializable, serialize
 from .base import TransactionType
 from .transaction_data_v1 import TransactionDataV1
 
-from ...utils.logging import setup_logging, get_logger
-import logging
 
 @dataclass
 class TransactionData(Serializable):
     """Complete transaction data structure matching C# implementation."""
     
-    setup_logging(level=logging.DEBUG, use_emojis=True)
-    logger = get_logger("sui_py.transactions.data.transaction_data")
-    
     transaction_type: TransactionType
     transaction_data_v1: TransactionDataV1
     
@@ -27,8 +22,6 @@ class TransactionData(Serializable):
         
         # Serialize V1 data
         self.transaction_data_v1.serialize(serializer)
-        
-        self.logger.debug(f"Serialized transaction data: {list(serializer.to_bytes())}")
     
     def to_bytes(self) -> bytes:
         """
@@ -10,16 +10,10 @@ from .gas_data import GasData
 from .transaction_expiration import TransactionExpiration
 
 
-from ...utils.logging import setup_logging, get_logger
-import logging
-
 @dataclass
 class TransactionDataV1(Serializable):
     """Transaction data V1 structure."""
     
-    setup_logging(level=logging.DEBUG, use_emojis=True)
-    logger = get_logger("sui_py.transactions.data.transaction_data_v1")
-    
     transaction_kind: TransactionKind
     sender: SuiAddress
     gas_data: GasData
@@ -37,8 +31,6 @@ class TransactionDataV1(Serializable):
         self._serialize_gas_data_with_fallback(serializer)
         
         self.expiration.serialize(serializer)
-        
-        self.logger.debug(f"Serialized transaction data V1: {list(serializer.to_bytes())}")
     
     def _serialize_gas_data_with_fallback(self, serializer: Serializer) -> None:
         """
@@ -3,6 +3,7 @@ Utility types and functions for transaction building.
 """
 
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Any, Optional, Union, List
 from typing_extensions import Self
 
@@ -21,6 +22,16 @@ class BcsString(BcsSerializable):
         serializer.write_vector_length(len(utf8_bytes))
         serializer.write_bytes(utf8_bytes)
     
+    @classmethod
+    def serialize_many(cls, strings: List["BcsString"], serializer: Serializer) -> None:
+        """Serialize strings back to back, as the elements of a BcsVector."""
+        write_length = serializer.write_vector_length
+        write_bytes = serializer.write_bytes
+        for string in strings:
+            utf8_bytes = string.value.encode('utf-8')
+            write_length(len(utf8_bytes))
+            write_bytes(utf8_bytes)
+    
     @classmethod
     def deserialize(cls, deserializer: Deserializer) -> Self:
         """Deserialize string from BCS."""
@@ -32,6 +43,26 @@ class BcsString(BcsSerializable):
         return self.value
 
 
+@lru_cache(maxsize=1024)
+def encode_identifier(name: str) -> bytes:
+    """
+    BCS-encode a Move identifier (module, function or struct name).
+    
+    The same few identifiers are serialized over and over, so the
+    length-prefixed UTF-8 encoding is built once per name and callers
+    write it with a single copy.
+    
+    Args:
+        name: The identifier
+        
+    Returns:
+        The ULEB128 length followed by the UTF-8 bytes, as BcsString writes it
+    """
+    serializer = Serializer(initial_capacity=len(name) + 5)
+    BcsString(name).serialize(serializer)
+    return serializer.to_bytes()
+
+
 def encode_pure_value(value: Any, type_hint: Optional[str] = None) -> bytes:
     """
     Encode a pure value using BCS serialization.
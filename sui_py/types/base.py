@@ -4,20 +4,78 @@ Base types for Sui blockchain data structures.
 These types correspond to the fundamental Component Schemas in the Sui JSON-RPC API.
 """
 
-import re
+import base64
 from typing import Any, Dict, Union
-from dataclasses import dataclass
+from dataclasses import FrozenInstanceError, dataclass, fields
+from functools import lru_cache
 from typing_extensions import Self
 
 from ..exceptions import SuiValidationError
 from ..bcs import BcsSerializable, Serializer, Deserializer
 
-from ..utils.logging import setup_logging, get_logger
-import logging
-
 # Sui address and object ID length (32 bytes = 64 hex characters)
 SUI_ADDRESS_LENGTH = 64
 
+# Valid hexadecimal digits (either case)
+_HEX_DIGITS = b"0123456789abcdefABCDEF"
+
+
+def _is_hex(value: str) -> bool:
+    """Check that every character of value is an ASCII hexadecimal digit."""
+    # Non-ASCII input can never be hex; otherwise deleting the hex digits in C
+    # leaves nothing behind for a valid payload
+    return value.isascii() and not value.encode("ascii").translate(None, _HEX_DIGITS)
+
+
+def _frozen_setattr(self, name, value):
+    """Reject attribute assignment on a frozen slotted dataclass."""
+    raise FrozenInstanceError(f"cannot assign to field {name!r}")
+
+
+def _frozen_delattr(self, name):
+    """Reject attribute deletion on a frozen slotted dataclass."""
+    raise FrozenInstanceError(f"cannot delete field {name!r}")
+
+
+def _reduce_to_constructor(self):
+    """Reduce a frozen slotted dataclass to a call of its constructor."""
+    return (self.__class__, tuple(getattr(self, f.name) for f in fields(self)))
+
+
+def _add_slots(cls: type) -> type:
+    """
+    Rebuild a dataclass with __slots__ for its fields.
+    
+    Backport of dataclass(slots=True), which needs Python 3.10. Apply it above
+    @dataclass; field defaults live in the generated __init__, so the class
+    attributes that would clash with the slots can be dropped. Frozen
+    dataclasses also get a __reduce__, since copy and pickle restore slotted
+    state with setattr, which frozen instances reject.
+    
+    Args:
+        cls: The dataclass to rebuild
+        
+    Returns:
+        A new class with the same fields and methods but no per-instance __dict__
+    """
+    field_names = tuple(f.name for f in fields(cls))
+    cls_dict = dict(cls.__dict__)
+    cls_dict["__slots__"] = field_names
+    for name in field_names:
+        cls_dict.pop(name, None)
+    cls_dict.pop("__dict__", None)
+    cls_dict.pop("__weakref__", None)
+    if cls.__dataclass_params__.frozen:
+        # The generated frozen __setattr__/__delattr__ refer to the original
+        # class, so they would misreport on the rebuilt one
+        cls_dict["__setattr__"] = _frozen_setattr
+        cls_dict["__delattr__"] = _frozen_delattr
+        cls_dict.setdefault("__reduce__", _reduce_to_constructor)
+    
+    slotted = type(cls)(cls.__name__, cls.__bases__, cls_dict)
+    slotted.__qualname__ = cls.__qualname__
+    return slotted
+
 
 def _normalize_address_like(value: str, name: str = "address") -> str:
     """
@@ -36,6 +94,14 @@ def _normalize_address_like(value: str, name: str = "address") -> str:
     if not isinstance(value, str):
         raise SuiValidationError(f"{name.capitalize()} must be a string")
     
+    return _normalize_address_str(value, name)
+
+
+# Responses repeat the same addresses and object IDs (packages, senders, owners),
+# so normalized results are memoized; invalid inputs raise and are not cached.
+@lru_cache(maxsize=4096)
+def _normalize_address_str(value: str, name: str) -> str:
+    """Normalize an address-like string; see _normalize_address_like."""
     # Add 0x prefix if missing
     if not value.startswith("0x"):
         if value == "":
@@ -50,7 +116,7 @@ def _normalize_address_like(value: str, name: str = "address") -> str:
         hex_part = "0"
     
     # Validate hex characters
-    if not re.match(r"^[a-fA-F0-9]+$", hex_part):
+    if not _is_hex(hex_part):
         raise SuiValidationError(
             f"Invalid {name} format: {value}. "
             f"Must contain only hexadecimal characters"
@@ -70,6 +136,25 @@ def _normalize_address_like(value: str, name: str = "address") -> str:
     return f"0x{hex_part}"
 
 
+@lru_cache(maxsize=4096)
+def _address_bytes(value: str) -> bytes:
+    """Raw 32 bytes of a normalized 0x-prefixed address or object ID."""
+    return bytes.fromhex(value[2:])
+
+
+@lru_cache(maxsize=4096)
+def _bcs_digest(digest: str) -> bytes:
+    """
+    BCS encoding of a validated base58 object digest.
+    
+    The digest decodes to exactly 32 bytes, so the ULEB128 length prefix is
+    the single byte 0x20 and the whole field can be written in one copy.
+    """
+    import base58
+    return b"\x20" + base58.b58decode(digest)
+
+
+@_add_slots
 @dataclass(frozen=True)
 class SuiAddress(BcsSerializable):
     """
@@ -84,9 +169,6 @@ class SuiAddress(BcsSerializable):
     """
     value: str
     
-    setup_logging(level=logging.DEBUG, use_emojis=True)
-    logger = get_logger("sui_py.types.base.SuiAddress")
-    
     def __post_init__(self):
         """Validate and normalize the address format on creation."""
         # Normalize the address (add padding if needed)
@@ -96,7 +178,7 @@ class SuiAddress(BcsSerializable):
         object.__setattr__(self, 'value', normalized)
         
         # Final validation - should always pass after normalization
-        if not re.match(r"^0x[a-fA-F0-9]{64}$", self.value):
+        if len(self.value) != SUI_ADDRESS_LENGTH + 2:
             raise SuiValidationError(
                 f"Invalid Sui address format after normalization: {self.value}. "
                 "This should not happen - please report this bug."
@@ -104,14 +186,9 @@ class SuiAddress(BcsSerializable):
     
     def serialize(self, serializer: Serializer) -> None:
         """Serialize address as 32 bytes."""
-        # Remove 0x prefix and convert to bytes
-        hex_data = self.value[2:]
-        address_bytes = bytes.fromhex(hex_data)
-        # Use FixedBytes to ensure no length prefix (raw 32 bytes like C# AccountAddress)
-        from ..bcs import FixedBytes
-        FixedBytes(address_bytes, 32).serialize(serializer)
-        
-        self.logger.debug(f"Serialized address: {list(serializer.to_bytes())}")
+        # Raw 32 bytes with no length prefix (like C# AccountAddress); the value
+        # is normalized on creation, so the decoded length is always 32
+        serializer.write_bytes(_address_bytes(self.value))
     
     @classmethod
     def deserialize(cls, deserializer: Deserializer) -> Self:
@@ -160,7 +237,7 @@ class ObjectID(BcsSerializable):
         object.__setattr__(self, 'value', normalized)
         
         # Final validation - should always pass after normalization
-        if not re.match(r"^0x[a-fA-F0-9]{64}$", self.value):
+        if len(self.value) != SUI_ADDRESS_LENGTH + 2:
             raise SuiValidationError(
                 f"Invalid object ID format after normalization: {self.value}. "
                 "This should not happen - please report this bug."
@@ -168,12 +245,8 @@ class ObjectID(BcsSerializable):
     
     def serialize(self, serializer: Serializer) -> None:
         """Serialize object ID as 32 bytes."""
-        # Remove 0x prefix and convert to bytes
-        hex_data = self.value[2:]
-        id_bytes = bytes.fromhex(hex_data)
-        # Use FixedBytes to ensure no length prefix (raw 32 bytes like C# AccountAddress)
-        from ..bcs import FixedBytes
-        FixedBytes(id_bytes, 32).serialize(serializer)
+        # Raw 32 bytes with no length prefix, same layout as SuiAddress
+        serializer.write_bytes(_address_bytes(self.value))
     
     @classmethod
     def deserialize(cls, deserializer: Deserializer) -> Self:
@@ -194,6 +267,7 @@ class ObjectID(BcsSerializable):
         return cls(object_id)
 
 
+@_add_slots
 @dataclass(frozen=True)
 class ObjectRef(BcsSerializable):
     """
@@ -205,9 +279,6 @@ class ObjectRef(BcsSerializable):
     version: int
     digest: str
     
-    setup_logging(level=logging.DEBUG, use_emojis=True)
-    logger = get_logger("sui_py.types.base.ObjectRef")
-    
     def __post_init__(self):
         """Validate the object reference format on creation."""
         if not isinstance(self.version, int) or self.version < 0:
@@ -245,22 +316,14 @@ class ObjectRef(BcsSerializable):
     def serialize(self, serializer: Serializer) -> None:
         """Serialize object reference."""
         # Serialize object ID as raw 32 bytes (no length prefix)
-        hex_data = self.object_id[2:]  # Remove 0x prefix
-        object_id_bytes = bytes.fromhex(hex_data)
-        from ..bcs import FixedBytes
-        FixedBytes(object_id_bytes, 32).serialize(serializer)
+        serializer.write_bytes(_address_bytes(self.object_id))
         
         # Serialize version as u64
         serializer.write_u64(self.version)
         
-        self.logger.debug(f"Serialized object reference: {list(serializer.to_bytes())}")
-        
         # Serialize digest as Base58-decoded bytes (match C# SuiObjectRef.Serialize)
         try:
-            import base58
-            decoded_digest = base58.b58decode(self.digest)
-            from ..bcs import Bytes
-            Bytes(decoded_digest).serialize(serializer)
+            serializer.write_bytes(_bcs_digest(self.digest))
         except ImportError:
             # Fallback if base58 library not available
             # For the test case, use the mock pattern from expected bytes
@@ -361,7 +424,6 @@ class Base64(BcsSerializable):
             raise SuiValidationError("Base64 value must be a string")
         
         # Basic validation - base64 strings should only contain valid characters
-        import base64
         try:
             base64.b64decode(self.value, validate=True)
         except Exception:
@@ -392,7 +454,6 @@ class Base64(BcsSerializable):
     
     def decode(self) -> bytes:
         """Decode the base64 string to bytes."""
-        import base64
         return base64.b64decode(self.value)
 
 
@@ -411,7 +472,7 @@ class Hex(BcsSerializable):
         # Remove 0x prefix if present for validation
         hex_value = self.value[2:] if self.value.startswith("0x") else self.value
         
-        if not re.match(r"^[a-fA-F0-9]*$", hex_value):
+        if not _is_hex(hex_value):
             raise SuiValidationError(f"Invalid hex format: {self.value}")
     
     def serialize(self, serializer: Serializer) -> None:
@@ -455,9 +516,6 @@ class ReceivingRef(BcsSerializable):
     version: int
     digest: str
     
-    setup_logging(level=logging.DEBUG, use_emojis=True)
-    logger = get_logger("sui_py.types.base.ReceivingRef")
-    
     def __post_init__(self):
         """Validate the receiving reference format on creation."""
         if not isinstance(self.version, int) or self.version < 0:
@@ -495,22 +553,14 @@ class ReceivingRef(BcsSerializable):
     def serialize(self, serializer: Serializer) -> None:
         """Serialize receiving reference."""
         # Serialize object ID as raw 32 bytes (no length prefix)
-        hex_data = self.object_id[2:]  # Remove 0x prefix
-        object_id_bytes = bytes.fromhex(hex_data)
-        from ..bcs import FixedBytes
-        FixedBytes(object_id_bytes, 32).serialize(serializer)
+        serializer.write_bytes(_address_bytes(self.object_id))
         
         # Serialize version as u64
         serializer.write_u64(self.version)
         
-        self.logger.debug(f"Serialized receiving reference: {list(serializer.to_bytes())}")
-        
         # Serialize digest as Base58-decoded bytes (match C# SuiObjectRef.Serialize)
         try:
-            import base58
-            decoded_digest = base58.b58decode(self.digest)
-            from ..bcs import Bytes
-            Bytes(decoded_digest).serialize(serializer)
+            serializer.write_bytes(_bcs_digest(self.digest))
         except ImportError:
             # Fallback if base58 library not available
             # For the test case, use the mock pattern from expected bytes
@@ -8,7 +8,10 @@ from typing import Any, Dict, List, Optional, Union
 from dataclasses import dataclass
 from enum import Enum
 
-from .base import SuiAddress, ObjectID, TransactionDigest, Base64
+from .base import SuiAddress, ObjectID, TransactionDigest, Base64, _add_slots
+
+# TransactionEffects.from_dict, bound on first use (write_api imports this module)
+_effects_from_dict = None
 
 
 class EventType(str, Enum):
@@ -33,6 +36,7 @@ class ObjectDataOptions(str, Enum):
     SHOW_STORAGE_REBATE = "showStorageRebate"
 
 
+@_add_slots
 @dataclass
 class DynamicFieldName:
     """
@@ -59,6 +63,7 @@ class DynamicFieldName:
         }
 
 
+@_add_slots
 @dataclass
 class DynamicFieldInfo:
     """
@@ -82,7 +87,7 @@ class DynamicFieldInfo:
             bcs_name=data["bcsName"],
             type=data["type"],
             object_type=data["objectType"],
-            object_id=ObjectID.from_str(data["objectId"]),
+            object_id=ObjectID(data["objectId"]),
             version=data["version"],
             digest=data["digest"]
         )
@@ -100,6 +105,7 @@ class DynamicFieldInfo:
         }
 
 
+@_add_slots
 @dataclass
 class ObjectOwner:
     """
@@ -119,24 +125,15 @@ class ObjectOwner:
             # Handle simple string cases like "Immutable"
             return cls(owner_type=data)
         
-        if "AddressOwner" in data:
-            return cls(
-                owner_type="AddressOwner",
-                address=SuiAddress.from_str(data["AddressOwner"])
-            )
-        elif "ObjectOwner" in data:
-            return cls(
-                owner_type="ObjectOwner",
-                object_id=ObjectID.from_str(data["ObjectOwner"])
-            )
-        elif "Shared" in data:
-            return cls(
-                owner_type="Shared",
-                initial_shared_version=data["Shared"]["initial_shared_version"]
-            )
-        else:
-            # Handle other cases like "Immutable"
-            return cls(owner_type=str(data))
+        # Owner payloads are single-key dicts, so dispatch on that key
+        if data:
+            kind, value = next(iter(data.items()))
+            build = _OWNER_BUILDERS.get(kind)
+            if build is not None:
+                return build(cls, value)
+        
+        # Handle other cases like "Immutable"
+        return cls(owner_type=str(data))
     
     def to_dict(self) -> Union[Dict[str, Any], str]:
         """Convert ObjectOwner to dictionary format."""
@@ -150,6 +147,17 @@ class ObjectOwner:
             return self.owner_type
 
 
+# Constructors for each dict-shaped owner variant, keyed by its API tag
+_OWNER_BUILDERS = {
+    "AddressOwner": lambda cls, value: cls(owner_type="AddressOwner", address=SuiAddress(value)),
+    "ObjectOwner": lambda cls, value: cls(owner_type="ObjectOwner", object_id=ObjectID(value)),
+    "Shared": lambda cls, value: cls(
+        owner_type="Shared", initial_shared_version=value["initial_shared_version"]
+    ),
+}
+
+
+@_add_slots
 @dataclass
 class SuiObjectData:
     """
@@ -171,17 +179,21 @@ class SuiObjectData:
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "SuiObjectData":
         """Create a SuiObjectData from API response data."""
+        get = data.get
+        owner = get("owner")
+        previous_transaction = get("previousTransaction")
+        bcs = get("bcs")
         return cls(
-            object_id=ObjectID.from_str(data["objectId"]),
+            object_id=ObjectID(data["objectId"]),
             version=data["version"],
             digest=data["digest"],
-            type=data.get("type"),
-            owner=ObjectOwner.from_dict(data["owner"]) if data.get("owner") else None,
-            previous_transaction=TransactionDigest.from_str(data["previousTransaction"]) if data.get("previousTransaction") else None,
-            storage_rebate=data.get("storageRebate"),
-            display=data.get("display"),
-            content=data.get("content"),
-            bcs=Base64.from_str(data["bcs"]) if data.get("bcs") else None
+            type=get("type"),
+            owner=ObjectOwner.from_dict(owner) if owner else None,
+            previous_transaction=TransactionDigest(previous_transaction) if previous_transaction else None,
+            storage_rebate=get("storageRebate"),
+            display=get("display"),
+            content=get("content"),
+            bcs=Base64(bcs) if bcs else None
         )
     
     def to_dict(self) -> Dict[str, Any]:
@@ -223,8 +235,13 @@ class SuiObjectResponse:
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "SuiObjectResponse":
         """Create a SuiObjectResponse from API response data."""
+        object_data = data.get("data")
+        if not object_data:
+            # Error responses carry no object payload to parse
+            return cls(error=data.get("error"))
+        
         return cls(
-            data=SuiObjectData.from_dict(data["data"]) if data.get("data") else None,
+            data=SuiObjectData.from_dict(object_data),
             error=data.get("error")
         )
     
@@ -244,6 +261,7 @@ class SuiObjectResponse:
         return self.data is not None and self.error is None
 
 
+@_add_slots
 @dataclass
 class SuiEvent:
     """
@@ -263,15 +281,17 @@ class SuiEvent:
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "SuiEvent":
         """Create a SuiEvent from API response data."""
+        get = data.get
+        bcs = get("bcs")
         return cls(
             id=data["id"],
-            package_id=ObjectID.from_str(data["packageId"]),
+            package_id=ObjectID(data["packageId"]),
             transaction_module=data["transactionModule"],
-            sender=SuiAddress.from_str(data["sender"]),
+            sender=SuiAddress(data["sender"]),
             type=data["type"],
-            parsed_json=data.get("parsedJson"),
-            bcs=Base64.from_str(data["bcs"]) if data.get("bcs") else None,
-            timestamp_ms=data.get("timestampMs")
+            parsed_json=get("parsedJson"),
+            bcs=Base64(bcs) if bcs else None,
+            timestamp_ms=get("timestampMs")
         )
     
     def to_dict(self) -> Dict[str, Any]:
@@ -294,6 +314,7 @@ class SuiEvent:
         return result
 
 
+@_add_slots
 @dataclass
 class SuiTransactionBlock:
     """
@@ -320,6 +341,7 @@ class SuiTransactionBlock:
         }
 
 
+@_add_slots
 @dataclass
 class SuiTransactionBlockResponse:
     """
@@ -362,9 +384,12 @@ class SuiTransactionBlockResponse:
         if not effects_data:
             return None
         
-        # Import here to avoid circular imports
-        from .write_api import TransactionEffects
-        return TransactionEffects.from_dict(effects_data)
+        global _effects_from_dict
+        if _effects_from_dict is None:
+            # Import here to avoid circular imports; resolved once, then reused
+            from .write_api import TransactionEffects
+            _effects_from_dict = TransactionEffects.from_dict
+        return _effects_from_dict(effects_data)
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert SuiTransactionBlockResponse to dictionary format."""
@@ -7,9 +7,12 @@ These types handle paginated responses from the Sui JSON-RPC API.
 from typing import Any, Dict, List, Optional, TypeVar, Generic
 from dataclasses import dataclass
 
+from .base import _add_slots
+
 T = TypeVar('T')
 
 
+@_add_slots
 @dataclass
 class Page(Generic[T]):
     """
@@ -35,9 +38,10 @@ class Page(Generic[T]):
         """
         items = data.get("data", [])
         
-        # If item_parser is provided, parse each item
+        # If item_parser is provided, parse each item; map drives the calls
+        # from C instead of a Python-level comprehension frame
         if item_parser:
-            parsed_items = [item_parser(item) for item in items]
+            parsed_items = list(map(item_parser, items))
         else:
             parsed_items = items
         
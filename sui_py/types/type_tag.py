@@ -10,16 +10,19 @@ from __future__ import annotations
 
 import re
 from dataclasses import dataclass
-from typing import List, Union
+from functools import lru_cache
+from typing import Tuple, Union
 from abc import ABC, abstractmethod
 
 from ..bcs import BcsSerializable, Serializer, Deserializer
-from .base import SuiAddress
+from .base import SuiAddress, _add_slots
 
 
 class TypeTag(BcsSerializable, ABC):
     """Base class for all Move type tags."""
     
+    __slots__ = ()
+    
     @abstractmethod
     def get_tag(self) -> int:
         """Get the enum variant tag for this type."""
@@ -36,7 +39,7 @@ class TypeTag(BcsSerializable, ABC):
         self.serialize_data(serializer)
 
 
-@dataclass
+@dataclass(frozen=True)
 class BoolTypeTag(TypeTag):
     """Boolean type tag."""
     
@@ -47,7 +50,7 @@ class BoolTypeTag(TypeTag):
         pass  # No additional data for bool type
 
 
-@dataclass
+@dataclass(frozen=True)
 class U8TypeTag(TypeTag):
     """U8 type tag."""
     
@@ -58,7 +61,7 @@ class U8TypeTag(TypeTag):
         pass  # No additional data for u8 type
 
 
-@dataclass 
+@dataclass(frozen=True)
 class U64TypeTag(TypeTag):
     """U64 type tag."""
     
@@ -69,7 +72,7 @@ class U64TypeTag(TypeTag):
         pass  # No additional data for u64 type
 
 
-@dataclass
+@dataclass(frozen=True)
 class U128TypeTag(TypeTag):
     """U128 type tag."""
     
@@ -80,7 +83,7 @@ class U128TypeTag(TypeTag):
         pass  # No additional data for u128 type
 
 
-@dataclass
+@dataclass(frozen=True)
 class AddressTypeTag(TypeTag):
     """Address type tag."""
     
@@ -91,7 +94,7 @@ class AddressTypeTag(TypeTag):
         pass  # No additional data for address type
 
 
-@dataclass
+@dataclass(frozen=True)
 class SignerTypeTag(TypeTag):
     """Signer type tag."""
     
@@ -102,7 +105,7 @@ class SignerTypeTag(TypeTag):
         pass  # No additional data for signer type
 
 
-@dataclass
+@dataclass(frozen=True)
 class VectorTypeTag(TypeTag):
     """Vector type tag."""
     element_type: TypeTag
@@ -114,36 +117,45 @@ class VectorTypeTag(TypeTag):
         self.element_type.serialize(serializer)
 
 
-@dataclass
+@_add_slots
+@dataclass(frozen=True)
 class StructTypeTag(TypeTag):
-    """Struct type tag with address, module, name, and type parameters."""
+    """
+    Struct type tag with address, module, name, and type parameters.
+    
+    type_params is stored as a tuple so the tag is fully immutable and
+    hashable; a list passed to the constructor is converted.
+    """
     address: SuiAddress
     module: str  
     name: str
-    type_params: List[TypeTag]
+    type_params: Tuple[TypeTag, ...]
+    
+    def __post_init__(self):
+        """Store the type parameters as a tuple."""
+        if not isinstance(self.type_params, tuple):
+            object.__setattr__(self, 'type_params', tuple(self.type_params))
     
     def get_tag(self) -> int:
         return 7
     
     def serialize_data(self, serializer: Serializer) -> None:
-        from sui_py.transactions.utils import BcsString
+        from sui_py.transactions.utils import encode_identifier
         from sui_py.bcs import bcs_vector
         
         # Serialize address (32 bytes)
         self.address.serialize(serializer)
         
-        # Serialize module name
-        BcsString(self.module).serialize(serializer)
-        
-        # Serialize struct name  
-        BcsString(self.name).serialize(serializer)
+        # Serialize module and struct names from their cached encodings
+        serializer.write_bytes(encode_identifier(self.module))
+        serializer.write_bytes(encode_identifier(self.name))
         
         # Serialize type parameters
-        type_params_vector = bcs_vector(self.type_params)
+        type_params_vector = bcs_vector(list(self.type_params))
         type_params_vector.serialize(serializer)
 
 
-@dataclass
+@dataclass(frozen=True)
 class U16TypeTag(TypeTag):
     """U16 type tag."""
     
@@ -154,7 +166,7 @@ class U16TypeTag(TypeTag):
         pass  # No additional data for u16 type
 
 
-@dataclass
+@dataclass(frozen=True)
 class U32TypeTag(TypeTag):
     """U32 type tag."""
     
@@ -165,7 +177,7 @@ class U32TypeTag(TypeTag):
         pass  # No additional data for u32 type
 
 
-@dataclass
+@dataclass(frozen=True)
 class U256TypeTag(TypeTag):
     """U256 type tag."""
     
@@ -176,10 +188,15 @@ class U256TypeTag(TypeTag):
         pass  # No additional data for u256 type
 
 
+@lru_cache(maxsize=1024)
 def parse_type_tag(type_str: str) -> TypeTag:
     """
     Parse a type string into a TypeTag.
     
+    Results are cached per type string, since Move calls repeat the same
+    type arguments. Cached instances are shared between callers, which is
+    safe because type tags are frozen and hold no mutable containers.
+    
     Args:
         type_str: Type string like "bool", "u64", "0x2::coin::Coin", etc.
         
@@ -224,16 +241,16 @@ def parse_type_tag(type_str: str) -> TypeTag:
             type_params_str = type_str[base_end+1:-1]
             
             # Parse type parameters
-            type_params = []
+            type_params = ()
             if type_params_str.strip():
                 # Simple split by comma (doesn't handle nested generics properly)
                 param_strs = [p.strip() for p in type_params_str.split(",")]
-                type_params = [parse_type_tag(p) for p in param_strs]
+                type_params = tuple(parse_type_tag(p) for p in param_strs)
             
             parts = base_type.split("::")
         else:
             parts = type_str.split("::")
-            type_params = []
+            type_params = ()
         
         if len(parts) == 3:
             address_str, module, name = parts
@@ -270,7 +287,7 @@ def deserialize_type_tag(deserializer: Deserializer) -> TypeTag:
         module = BcsString.deserialize(deserializer).value
         name = BcsString.deserialize(deserializer).value
         type_params_vector = BcsVector.deserialize(deserializer, deserialize_type_tag)
-        type_params = type_params_vector.elements
+        type_params = tuple(type_params_vector.elements)
         
         return StructTypeTag(address, module, name, type_params)
     elif tag == 8:
@@ -0,0 +1,57 @@
+"""
+Shared pytest fixtures for the SuiPy SDK test suite.
+"""
+
+import pytest
+import re
+import sys
+import os
+
+try:
+    import pytest_asyncio
+except ImportError:
+    pytest_asyncio = None
+
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
+# Add the parent directory to the path to import sui_py and the test data package
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_configure(config):
+    """Register the custom markers used by the suite and skip benchmarks by default."""
+    config.addinivalue_line(
+        "markers",
+        "crossscheme: test needs more than one signature scheme backend "
+        "(deselect with '-m \"not crossscheme\"')"
+    )
+    # Benchmarks only run on request (--benchmark-only overrides the skip); this has
+    # to happen before pytest-benchmark reads its options in its own pytest_configure
+    if config.pluginmanager.hasplugin("benchmark"):
+        config.option.benchmark_skip = True
+
+
+def _release(version: str) -> tuple:
+    """Major and minor release numbers of a version string, e.g. (1, 4)."""
+    match = re.match(r"(\d+)\.(\d+)", version)
+    return (int(match.group(1)), int(match.group(2))) if match else (0, 0)
+
+
+# Run the async tests on uvloop when it and pytest-asyncio are installed (uvloop
+# has no Windows support). pytest-asyncio 1.4 replaced the event_loop_policy
+# fixture with a loop factory hook.
+if pytest_asyncio is not None and uvloop is not None and sys.platform != "win32":
+    if _release(pytest_asyncio.__version__) >= (1, 4):
+        @pytest.hookimpl(optionalhook=True)
+        def pytest_asyncio_loop_factories(config, item):
+            """Create every test event loop with uvloop."""
+            return {"uvloop": uvloop.new_event_loop}
+    else:
+        @pytest.fixture(scope="session")
+        def event_loop_policy():
+            """Create every test event loop with uvloop."""
+            return uvloop.EventLoopPolicy()
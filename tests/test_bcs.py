@@ -8,11 +8,6 @@ Based on test cases from the C# Sui Unity SDK for comprehensive coverage.
 """
 
 import pytest
-import sys
-import os
-
-# Add the parent directory to the path to import sui_py
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from sui_py.bcs import (
     # Core functions
@@ -24,9 +19,10 @@ from sui_py.bcs import (
     # Factory functions
     u8, u16, u32, u64, u128, u256, boolean, bytes_value, fixed_bytes,
     # Low-level access
-    Serializer, Deserializer,
+    Serializer, Deserializer, compile_serializer, compile_deserializer,
     # Exceptions
-    OverflowError, InsufficientDataError, InvalidDataError, DeserializationError
+    OverflowError, InsufficientDataError, InvalidDataError, DeserializationError,
+    SerializationError
 )
 
 
@@ -202,82 +198,38 @@ class TestPrimitiveTypes:
         
         assert input_val == output_val
     
-    def test_u8_serialization(self):
-        """Test U8 serialization and deserialization."""
-        value = U8(255)
-        data = serialize(value)
-        
-        # U8 should be exactly 1 byte
-        assert len(data) == 1
-        assert data == b'\xff'
-        
-        # Test deserialization
-        restored = deserialize(data, U8.deserialize)
-        assert restored.value == 255
-        assert isinstance(restored, U8)
-    
-    def test_u16_serialization(self):
-        """Test U16 serialization and deserialization."""
-        value = U16(65535)
-        data = serialize(value)
-        
-        # U16 should be exactly 2 bytes (little-endian)
-        assert len(data) == 2
-        assert data == b'\xff\xff'
-        
-        # Test deserialization
-        restored = deserialize(data, U16.deserialize)
-        assert restored.value == 65535
-    
-    def test_u32_serialization(self):
-        """Test U32 serialization and deserialization."""
-        value = U32(0x12345678)
-        data = serialize(value)
-        
-        # U32 should be exactly 4 bytes (little-endian)
-        assert len(data) == 4
-        assert data == b'\x78\x56\x34\x12'
-        
-        # Test deserialization
-        restored = deserialize(data, U32.deserialize)
-        assert restored.value == 0x12345678
-    
-    def test_u64_serialization(self):
-        """Test U64 serialization and deserialization."""
-        value = U64(12345)
-        data = serialize(value)
-        
-        # U64 should be exactly 8 bytes
-        assert len(data) == 8
-        
-        # Test deserialization
-        restored = deserialize(data, U64.deserialize)
-        assert restored.value == 12345
-    
-    def test_u128_serialization(self):
-        """Test U128 serialization and deserialization."""
-        value = U128(0x123456789abcdef0fedcba9876543210)
-        data = serialize(value)
-        
-        # U128 should be exactly 16 bytes
-        assert len(data) == 16
-        
-        # Test deserialization
-        restored = deserialize(data, U128.deserialize)
-        assert restored.value == 0x123456789abcdef0fedcba9876543210
-    
-    def test_u256_serialization(self):
-        """Test U256 serialization and deserialization."""
-        large_value = (1 << 255) - 1  # Large but valid U256
-        value = U256(large_value)
-        data = serialize(value)
-        
-        # U256 should be exactly 32 bytes
-        assert len(data) == 32
+    @pytest.mark.parametrize("value,expected", [
+        (0, b"\x00"),
+        (127, b"\x7f"),
+        (128, b"\x80\x01"),
+        (16383, b"\xff\x7f"),
+        (16384, b"\x80\x80\x01"),
+    ])
+    def test_uleb128_byte_boundaries(self, value, expected):
+        """Test ULEB128 encoding on either side of the one-byte fast path."""
+        serializer = Serializer(initial_capacity=1)
+        serializer.write_uleb128(value)
+        assert serializer.to_bytes() == expected
+    
+    @pytest.mark.parametrize("cls,value,expected", [
+        (U8, 255, b'\xff'),
+        (U16, 65535, b'\xff\xff'),
+        (U32, 0x12345678, b'\x78\x56\x34\x12'),
+        (U64, 12345, bytes.fromhex("3930000000000000")),
+        (U128, 0x123456789abcdef0fedcba9876543210, bytes.fromhex("1032547698badcfef0debc9a78563412")),
+        (U256, (1 << 255) - 1, bytes.fromhex("ff" * 31 + "7f")),
+    ])
+    def test_unsigned_integer_serialization(self, cls, value, expected):
+        """Test fixed-width unsigned integer serialization and deserialization."""
+        data = serialize(cls(value))
+        
+        # Fixed-width integers are exactly their width in bytes, little-endian
+        assert data == expected
         
         # Test deserialization
-        restored = deserialize(data, U256.deserialize)
-        assert restored.value == large_value
+        restored = deserialize(data, cls.deserialize)
+        assert restored.value == value
+        assert isinstance(restored, cls)
     
     def test_bool_serialization(self):
         """Test Bool serialization and deserialization."""
@@ -298,6 +250,27 @@ class TestPrimitiveTypes:
         
         restored_false = deserialize(false_data, Bool.deserialize)
         assert restored_false.value is False
+        
+        # Only two Bool instances ever exist
+        assert Bool(True) is Bool.TRUE and restored_true is Bool.TRUE
+        assert Bool(False) is Bool.FALSE and restored_false is Bool.FALSE
+        with pytest.raises(ValueError):
+            Bool(1)
+        assert Bool.TRUE.value is True
+
+    def test_direct_encoding_matches_serializer(self):
+        """Test to_bcs/from_bcs agree with the Serializer/Deserializer path."""
+        for value in [U8(200), U16(0x1234), U32(0x12345678), U64(2**64 - 1),
+                      U128((1 << 128) - 1), U256((1 << 255) + 7), Bool(True), Bool(False)]:
+            serializer = Serializer()
+            value.serialize(serializer)
+            assert value.to_bcs() == serializer.to_bytes()
+            assert type(value).from_bcs(value.to_bcs()) == value
+
+        with pytest.raises(InsufficientDataError):
+            U32.from_bcs(b'\x01\x02')
+        with pytest.raises(InvalidDataError):
+            Bool.from_bcs(b'\x02')
     
     def test_bytes_serialization(self):
         """Test Bytes serialization and deserialization."""
@@ -326,6 +299,23 @@ class TestPrimitiveTypes:
         restored = deserialize(data, lambda d: FixedBytes.deserialize(d, 8))
         assert restored.value == test_data
         assert restored.expected_length == 8
+    
+    def test_deserialize_from_buffer_view(self):
+        """Test deserializing straight from a Serializer buffer view."""
+        serializer = Serializer()
+        U64(2**40).serialize(serializer)
+        Bytes(b"abc").serialize(serializer)
+        
+        view = serializer.getbuffer()
+        assert view.readonly
+        assert view == serializer.to_bytes()
+        
+        deserializer = Deserializer(view)
+        assert U64.deserialize(deserializer).value == 2**40
+        restored = Bytes.deserialize(deserializer)
+        assert type(restored.value) is bytes
+        assert restored.value == b"abc"
+        assert deserializer.is_empty()
 
 
 class TestContainerTypes:
@@ -363,7 +353,51 @@ class TestContainerTypes:
         restored = deserialize(data, lambda d: BcsVector.deserialize(d, U8.deserialize))
         assert len(restored) == 3
         assert [elem.value for elem in restored.elements] == [1, 2, 3]
-    
+
+    def test_typed_vector_deserialization(self):
+        """Test BcsVector.deserialize_typed matches the generic element path."""
+        for element_type, values in [
+            (U8, [0, 1, 255]),
+            (U16, [0, 65535]),
+            (U32, [999, 4294967295]),
+            (U64, [2**64 - 1, 42]),
+            (Bool, [True, False, True]),
+            (U128, [2**128 - 1]),
+        ]:
+            data = serialize(bcs_vector([element_type(v) for v in values]))
+            typed = deserialize(data, lambda d: BcsVector.deserialize_typed(d, element_type))
+            generic = deserialize(data, lambda d: BcsVector.deserialize(d, element_type.deserialize))
+            assert typed == generic
+            assert [elem.value for elem in typed] == values
+
+        with pytest.raises(InvalidDataError):
+            deserialize(b'\x02\x01\x02', lambda d: BcsVector.deserialize_typed(d, Bool))
+        with pytest.raises(InsufficientDataError):
+            deserialize(b'\x02\x01\x00', lambda d: BcsVector.deserialize_typed(d, U32))
+
+    def test_packed_vector_storage(self):
+        """Test packed primitive vectors behave like vectors of wrapper objects."""
+        packed = bcs_vector([1, 2, 0xFFFF], element_type=U16)
+        unpacked = bcs_vector([U16(1), U16(2), U16(0xFFFF)])
+        assert packed.is_packed()
+        assert serialize(packed) == serialize(unpacked) == b'\x03\x01\x00\x02\x00\xff\xff'
+        assert packed == unpacked
+        assert packed[2] == U16(0xFFFF)
+
+        packed.append(U16(7))
+        packed.extend([8])
+        packed[0] = 9
+        assert [elem.value for elem in packed] == [9, 2, 0xFFFF, 7, 8]
+
+        assert serialize(bcs_vector(b'\x01\x02', element_type=U8)) == b'\x02\x01\x02'
+        with pytest.raises(OverflowError):
+            bcs_vector([256], element_type=U8)
+
+        # Accessing .elements converts to list storage so mutations stick
+        packed.elements.append(U16(10))
+        assert not packed.is_packed()
+        assert len(packed) == 6
+
     def test_empty_vector_serialization(self):
         """Test empty BcsVector serialization."""
         vector = bcs_vector([])
@@ -425,6 +459,42 @@ class TestContainerTypes:
         assert restored[1].is_none()
         assert restored[2].is_some() and restored[2].unwrap().value == 3
 
+    def test_compiled_shape_serializers(self):
+        """Test compiled per-shape serializers match the generic container path."""
+        shape = ("vector", ("option", U32))
+        vector = bcs_vector([bcs_some(U32(1)), bcs_none(), bcs_some(U32(0xFFFFFFFF))])
+
+        serializer = Serializer()
+        compile_serializer(shape)(vector, serializer)
+        data = serializer.to_bytes()
+        assert data == serialize(vector)
+        assert compile_serializer(shape) is compile_serializer(shape)
+
+        restored = compile_deserializer(shape)(Deserializer(data))
+        assert restored == vector
+
+        bytes_shape = ("vector", Bytes)
+        strings = bcs_vector([Bytes(b"a"), Bytes(b"abc")])
+        serializer = Serializer()
+        compile_serializer(bytes_shape)(strings, serializer)
+        assert serializer.to_bytes() == serialize(strings)
+        assert compile_deserializer(bytes_shape)(Deserializer(serializer.to_bytes())) == strings
+
+        with pytest.raises(ValueError):
+            compile_serializer(("map", U8))
+
+    def test_compiled_shape_packed_vectors(self):
+        """Test compiled serializers only write packed data of the matching width."""
+        serializer = Serializer()
+        compile_serializer(("vector", U16))(bcs_vector([1, 0xFFFF], element_type=U16), serializer)
+        assert serializer.to_bytes() == b'\x02\x01\x00\xff\xff'
+
+        mismatched = bcs_vector([1, 2, 3], element_type=U64)
+        with pytest.raises(SerializationError):
+            compile_serializer(("vector", U8))(mismatched, Serializer())
+        with pytest.raises(SerializationError):
+            compile_serializer(("vector", Bool))(mismatched, Serializer())
+
 
 class TestErrorHandling:
     """Test cases for BCS error handling."""
@@ -439,6 +509,11 @@ class TestErrorHandling:
         
         with pytest.raises(OverflowError):
             U32(4294967296)  # Too large for U32
+        
+        # Negative values are rejected by the same range check
+        for cls in (U8, U16, U32, U64, U128, U256):
+            with pytest.raises(OverflowError):
+                cls(-1)
     
     def test_insufficient_data_error(self):
         """Test insufficient data error during deserialization."""
@@ -508,6 +583,37 @@ def test_convenience_functions():
     assert restored.value == 42
 
 
+def test_serialize_reuses_buffer_safely():
+    """Test repeated and nested serialize calls do not share output state."""
+    first = serialize(bcs_vector([U8(1), U8(2)]))
+    second = serialize(bcs_vector([U8(3)]))
+    assert first == b'\x02\x01\x02'
+    assert second == b'\x01\x03'
+
+    class Nested:
+        def serialize(self, serializer):
+            inner = serialize(bcs_vector([U16(7)]))
+            serializer.write_bytes(inner)
+
+    assert serialize(bcs_vector([Nested(), Nested()])) == b'\x02' + b'\x01\x07\x00' * 2
+
+
+def test_serialize_releases_oversized_buffer():
+    """Test a large payload does not leave a peak-sized buffer on the thread."""
+    import sui_py.bcs as bcs
+
+    small = bcs_vector([U8(1)])
+    serialize(small)
+    reused = bcs._thread_local.serializer
+    serialize(small)
+    assert bcs._thread_local.serializer is reused
+
+    payload = b'\xab' * (bcs._MAX_RETAINED_CAPACITY * 2)
+    assert serialize(Bytes(payload))[-4:] == payload[-4:]
+    serialize(small)
+    assert bcs._thread_local.serializer.capacity() <= bcs._MAX_RETAINED_CAPACITY
+
+
 def test_factory_functions():
     """Test primitive factory functions."""
     # Test that factory functions work
@@ -519,6 +625,18 @@ def test_factory_functions():
     assert bytes_value(b"test").value == b"test"
 
 
+def test_wrappers_use_slots():
+    """Test wrapper types are slotted and still copy/pickle cleanly."""
+    import copy
+    import pickle
+
+    for value in [U8(1), U256(2**200), Bool(False), Bytes(b"ab"), FixedBytes(b"ab", 2),
+                  bcs_vector([U8(1)]), bcs_some(U8(2))]:
+        assert not hasattr(value, "__dict__")
+        assert copy.deepcopy(value) == value
+        assert pickle.loads(pickle.dumps(value)) == value
+
+
 def test_basic_functionality():
     """Basic smoke test for BCS functionality."""
     print("Testing BCS implementation...")
@@ -627,6 +745,4 @@ class TestComplexSerialization:
 
 
 if __name__ == "__main__":
-    # Run basic functionality test
-    test_basic_functionality()
-    print("\n🎉 BCS implementation is working correctly!") 
\ No newline at end of file
+    pytest.main([__file__])
\ No newline at end of file
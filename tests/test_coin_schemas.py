@@ -4,12 +4,18 @@ Tests for Coin Query API schemas.
 Tests the typed schemas for proper validation, parsing, and functionality.
 """
 
+import copy
+import dataclasses
+import pickle
+
+import base58
 import pytest
 from sui_py.types import (
-    SuiAddress, ObjectID, TransactionDigest, 
+    SuiAddress, ObjectID, ObjectRef, TransactionDigest, 
     Balance, Coin, SuiCoinMetadata, Supply, Page
 )
 from sui_py.exceptions import SuiValidationError
+from sui_py.bcs import serialize
 
 
 class TestBaseTypes:
@@ -33,12 +39,44 @@ class TestBaseTypes:
         with pytest.raises(SuiValidationError):
             SuiAddress.from_str("1234567890abcdef1234567890abcdef1234567890abcdef1234567890abcdef")  # No 0x prefix
     
+    def test_sui_address_rejects_non_hex(self):
+        """Test SuiAddress rejects non-hex characters, including whitespace."""
+        for bad in ("0x12g4", "0xabc\n", "0x ab", "0x-1", "0x12\u0663", "0x\uff11"):
+            with pytest.raises(SuiValidationError):
+                SuiAddress.from_str(bad)
+        
+        assert SuiAddress.from_str("0xABC").value == "0x" + "0" * 61 + "ABC"
+    
     def test_object_id_valid(self):
         """Test valid ObjectID creation."""
         valid_id = "0xabcdef1234567890abcdef1234567890abcdef1234567890abcdef1234567890"
         obj_id = ObjectID.from_str(valid_id)
         assert str(obj_id) == valid_id
     
+    def test_address_like_serialization(self):
+        """Test SuiAddress and ObjectID serialize as 32 raw bytes."""
+        raw = bytes.fromhex("00" * 31 + "02")
+        assert serialize(SuiAddress("0x2")) == raw
+        assert serialize(ObjectID("0x2")) == raw
+    
+    def test_object_ref_serialization(self):
+        """Test ObjectRef serializes as ID, u64 version and length-prefixed digest bytes."""
+        digest_bytes = bytes(range(32))
+        ref = ObjectRef("0x2", 7, base58.b58encode(digest_bytes).decode())
+        
+        expected = bytes.fromhex("00" * 31 + "02") + (7).to_bytes(8, "little") + b"\x20" + digest_bytes
+        assert serialize(ref) == expected
+    
+    def test_sui_address_slots(self):
+        """Test the slotted, frozen SuiAddress still copies, pickles and rejects writes."""
+        address = SuiAddress("0x2")
+        assert not hasattr(address, "__dict__")
+        assert copy.deepcopy(address) == address
+        assert pickle.loads(pickle.dumps(address)) == address
+        
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            address.value = "0x3"
+    
     def test_transaction_digest_valid(self):
         """Test valid TransactionDigest creation."""
         valid_digest = "9jR9vbXjWaUbwg7aRKKHkZqZQYzFzFzFzFzFzFzFzF"  # Example base58
@@ -2,11 +2,12 @@
 Test data package for SuiPy SDK tests.
 
 Contains sample JSON responses from Sui RPC API for testing and validation.
-Organized by API type: write_api, read_api, move_utils.
+Organized by API type: write_api, read_api, move_utils. Binary transaction
+serialization vectors live under transactions.
 
 This data is used by unit tests to validate schema parsing and response handling.
 """
 
-from .loader import load_json, load_all_samples
+from .loader import load_json, load_bytes, load_all_samples, clear_cache
 
-__all__ = ["load_json", "load_all_samples"]
+__all__ = ["load_json", "load_bytes", "load_all_samples", "clear_cache"]
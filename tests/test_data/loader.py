@@ -4,32 +4,95 @@ Utility functions for loading test data JSON files.
 
 import json
 import os
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Tuple
+
+try:
+    # orjson parses the raw bytes in native code, noticeably faster than json
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads
+
+
+@lru_cache(maxsize=None)
+def _load_json_cached(path_str: str) -> Any:
+    """Read and parse a JSON file once per absolute path."""
+    return _loads(Path(path_str).read_bytes())
+
+
+@lru_cache(maxsize=None)
+def _load_bytes_cached(path_str: str) -> bytes:
+    """Read a binary file once per absolute path."""
+    return Path(path_str).read_bytes()
+
+
+@lru_cache(maxsize=None)
+def _list_samples(api_type: str) -> Tuple[Path, ...]:
+    """Scan an API type directory once and return its JSON files, sorted."""
+    api_path = Path(__file__).parent / api_type
+    if not api_path.exists():
+        return ()
+    return tuple(sorted(api_path.glob("*.json")))
+
+
+def clear_cache() -> None:
+    """
+    Forget cached directory listings and parsed files.
+    
+    Call this after adding or editing sample files at runtime.
+    """
+    _list_samples.cache_clear()
+    _load_json_cached.cache_clear()
+    _load_bytes_cached.cache_clear()
 
 
 def load_json(filename: str) -> Dict[str, Any]:
     """
     Load JSON test data file.
     
+    Parsed files are cached, so repeated loads of the same file return the
+    same object. Treat the result as read-only (or ``copy.deepcopy`` it first).
+    
     Args:
         filename: Relative path to JSON file (e.g., "write_api/execute_transaction_block_success.json")
-        
+    
     Returns:
         Parsed JSON data as dictionary
-        
+    
     Raises:
         FileNotFoundError: If the JSON file doesn't exist
         json.JSONDecodeError: If the JSON is malformed
     """
     base_path = Path(__file__).parent
-    file_path = base_path / filename
+    file_path = (base_path / filename).resolve()
+    
+    if not file_path.exists():
+        raise FileNotFoundError(f"Test data file not found: {file_path}")
+    
+    return _load_json_cached(str(file_path))
+
+
+def load_bytes(filename: str) -> bytes:
+    """
+    Load a binary test vector.
+    
+    Args:
+        filename: Relative path to the file (e.g., "transactions/expected_single_input.bin")
+    
+    Returns:
+        Raw file contents
+    
+    Raises:
+        FileNotFoundError: If the file doesn't exist
+    """
+    file_path = (Path(__file__).parent / filename).resolve()
     
     if not file_path.exists():
         raise FileNotFoundError(f"Test data file not found: {file_path}")
     
-    with open(file_path, 'r', encoding='utf-8') as f:
-        return json.load(f)
+    return _load_bytes_cached(str(file_path))
 
 
 def load_all_samples(api_type: str) -> Dict[str, Dict[str, Any]]:
@@ -38,7 +101,7 @@ def load_all_samples(api_type: str) -> Dict[str, Dict[str, Any]]:
     
     Args:
         api_type: API type directory name ("write_api", "read_api", "move_utils")
-        
+    
     Returns:
         Dictionary mapping filename to JSON data
     """
@@ -48,12 +111,10 @@ def load_all_samples(api_type: str) -> Dict[str, Dict[str, Any]]:
     if not api_path.exists():
         raise FileNotFoundError(f"API type directory not found: {api_path}")
     
-    samples = {}
-    for json_file in api_path.glob("*.json"):
-        with open(json_file, 'r', encoding='utf-8') as f:
-            samples[json_file.stem] = json.load(f)
-    
-    return samples
+    return {
+        json_file.stem: _load_json_cached(str(json_file.resolve()))
+        for json_file in _list_samples(api_type)
+    }
 
 
 def get_sample_names(api_type: str) -> List[str]:
@@ -62,14 +123,8 @@ def get_sample_names(api_type: str) -> List[str]:
     
     Args:
         api_type: API type directory name
-        
+    
     Returns:
         List of sample file names (without .json extension)
     """
-    base_path = Path(__file__).parent
-    api_path = base_path / api_type
-    
-    if not api_path.exists():
-        return []
-    
-    return [f.stem for f in api_path.glob("*.json")]
+    return [f.stem for f in _list_samples(api_type)]
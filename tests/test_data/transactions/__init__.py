@@ -0,0 +1,8 @@
+"""
+Transaction serialization test vectors.
+
+Contains raw BCS bytes expected by the transaction serialization tests,
+taken from the C# Sui Unity SDK TransactionsTest.cs:
+- expected_single_input.bin (TransactionDataSerializationSingleInput)
+- expected_multiple_input.bin (TransactionDataSerialization)
+"""
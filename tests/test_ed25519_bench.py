@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""
+Ed25519 performance benchmarks.
+
+Micro-benchmarks for signing, verification, batch verification and address
+derivation, so a slow crypto backend or a lost cache shows up in CI.
+Skipped when pytest-benchmark is not installed, and skipped in a plain
+``pytest tests`` run (see tests/conftest.py); pass --benchmark-only to run them.
+
+Save a baseline and fail on regressions:
+    python -m pytest tests/test_ed25519_bench.py --benchmark-only --benchmark-autosave
+    python -m pytest tests/test_ed25519_bench.py --benchmark-only --benchmark-compare --benchmark-compare-fail=mean:10%
+"""
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+from sui_py import Ed25519PrivateKey, Ed25519PublicKey
+
+# Batch size for verify_batch benchmarks
+BATCH_SIZE = 128
+
+MESSAGE = b"Benchmark message for Ed25519 signing and verification"
+
+
+@pytest.fixture(scope="module")
+def keypair():
+    """One Ed25519 key pair with a signature over MESSAGE."""
+    private_key = Ed25519PrivateKey.generate()
+    return private_key, private_key.public_key(), private_key.sign(MESSAGE)
+
+
+@pytest.fixture(scope="module")
+def batch():
+    """BATCH_SIZE distinct (public key, message, signature) triples."""
+    private_keys = [Ed25519PrivateKey.generate() for _ in range(BATCH_SIZE)]
+    messages = [MESSAGE + i.to_bytes(4, "little") for i in range(BATCH_SIZE)]
+    public_keys = [key.public_key() for key in private_keys]
+    signatures = [key.sign(message) for key, message in zip(private_keys, messages)]
+    return public_keys, messages, signatures
+
+
+@pytest.mark.benchmark(group="ed25519")
+def test_bench_sign(benchmark, keypair):
+    """Benchmark signing a short message."""
+    private_key, _, signature = keypair
+    assert benchmark(private_key.sign, MESSAGE).to_bytes() == signature.to_bytes()
+
+
+@pytest.mark.benchmark(group="ed25519")
+def test_bench_verify(benchmark, keypair):
+    """Benchmark verifying a single signature."""
+    _, public_key, signature = keypair
+    assert benchmark(public_key.verify, MESSAGE, signature) is True
+
+
+@pytest.mark.benchmark(group="ed25519")
+def test_bench_verify_batch(benchmark, batch):
+    """Benchmark verifying BATCH_SIZE signatures in one call."""
+    public_keys, messages, signatures = batch
+    assert benchmark(Ed25519PublicKey.verify_batch, public_keys, messages, signatures) is True
+
+
+@pytest.mark.benchmark(group="ed25519")
+def test_bench_to_sui_address(benchmark, keypair):
+    """Benchmark deriving the Sui address from a public key."""
+    _, public_key, _ = keypair
+    assert str(benchmark(public_key.to_sui_address)).startswith("0x")
@@ -15,6 +15,10 @@ from sui_py.types import (
 )
 from sui_py.exceptions import SuiValidationError
 
+# Full-length addresses shared by the object, event and pagination tests
+ADDR_A = "0x1234567890abcdef1234567890abcdef1234567890abcdef1234567890abcdef"
+ADDR_B = "0xabcdef1234567890abcdef1234567890abcdef1234567890abcdef1234567890"
+
 
 class TestDynamicFields:
     """Test dynamic field types."""
@@ -52,7 +56,7 @@ class TestDynamicFields:
             "bcsName": "0x746573745f6669656c64",
             "type": "DynamicField",
             "objectType": "0x2::dynamic_field::Field<0x1::string::String, u64>",
-            "objectId": "0x1234567890abcdef1234567890abcdef1234567890abcdef1234567890abcdef",
+            "objectId": ADDR_A,
             "version": 1,
             "digest": "abc123"
         }
@@ -69,56 +73,35 @@ class TestDynamicFields:
 class TestObjectTypes:
     """Test object-related types."""
     
-    def test_object_owner_address_owner(self):
-        """Test ObjectOwner with AddressOwner."""
-        data = {
-            "AddressOwner": "0x1234567890abcdef1234567890abcdef1234567890abcdef1234567890abcdef"
-        }
-        
-        owner = ObjectOwner.from_dict(data)
-        assert owner.owner_type == "AddressOwner"
-        assert isinstance(owner.address, SuiAddress)
-        assert str(owner.address) == data["AddressOwner"]
-    
-    def test_object_owner_object_owner(self):
-        """Test ObjectOwner with ObjectOwner."""
-        data = {
-            "ObjectOwner": "0xabcdef1234567890abcdef1234567890abcdef1234567890abcdef1234567890"
-        }
-        
-        owner = ObjectOwner.from_dict(data)
-        assert owner.owner_type == "ObjectOwner"
-        assert isinstance(owner.object_id, ObjectID)
-        assert str(owner.object_id) == data["ObjectOwner"]
-    
-    def test_object_owner_shared(self):
-        """Test ObjectOwner with Shared."""
-        data = {
-            "Shared": {
-                "initial_shared_version": 123
-            }
-        }
-        
+    @pytest.mark.parametrize("data,owner_type,attr,attr_type,value", [
+        ({"AddressOwner": ADDR_A}, "AddressOwner", "address", SuiAddress, ADDR_A),
+        ({"ObjectOwner": ADDR_B}, "ObjectOwner", "object_id", ObjectID, ADDR_B),
+        ({"Shared": {"initial_shared_version": 123}}, "Shared", "initial_shared_version", int, "123"),
+        ("Immutable", "Immutable", "address", type(None), "None"),
+    ], ids=["address_owner", "object_owner", "shared", "immutable"])
+    def test_object_owner_from_dict(self, data, owner_type, attr, attr_type, value):
+        """Test ObjectOwner parsing for each ownership variant."""
         owner = ObjectOwner.from_dict(data)
-        assert owner.owner_type == "Shared"
-        assert owner.initial_shared_version == 123
+        assert owner.owner_type == owner_type
+        assert isinstance(getattr(owner, attr), attr_type)
+        assert str(getattr(owner, attr)) == value
     
-    def test_object_owner_immutable(self):
-        """Test ObjectOwner with Immutable."""
-        data = "Immutable"
-        
-        owner = ObjectOwner.from_dict(data)
-        assert owner.owner_type == "Immutable"
+    def test_object_owner_is_slotted(self):
+        """Test ObjectOwner instances carry no per-instance __dict__."""
+        owner = ObjectOwner.from_dict({"AddressOwner": ADDR_A})
+        assert not hasattr(owner, "__dict__")
+        with pytest.raises(AttributeError):
+            owner.extra = 1
     
     def test_sui_object_data_from_dict(self):
         """Test SuiObjectData creation from dictionary."""
         data = {
-            "objectId": "0x1234567890abcdef1234567890abcdef1234567890abcdef1234567890abcdef",
+            "objectId": ADDR_A,
             "version": 1,
             "digest": "abc123",
             "type": "0x2::coin::Coin<0x2::sui::SUI>",
             "owner": {
-                "AddressOwner": "0xabcdef1234567890abcdef1234567890abcdef1234567890abcdef1234567890"
+                "AddressOwner": ADDR_B
             },
             "previousTransaction": "9jR9vbXjWaUbwg7aRKKHkZqZQYzFzFzFzFzFzFzFzF",
             "storageRebate": 100,
@@ -129,7 +112,7 @@ class TestObjectTypes:
                 "fields": {
                     "balance": "1000000000",
                     "id": {
-                        "id": "0x1234567890abcdef1234567890abcdef1234567890abcdef1234567890abcdef"
+                        "id": ADDR_A
                     }
                 }
             }
@@ -149,7 +132,7 @@ class TestObjectTypes:
         """Test SuiObjectResponse with successful data."""
         data = {
             "data": {
-                "objectId": "0x1234567890abcdef1234567890abcdef1234567890abcdef1234567890abcdef",
+                "objectId": ADDR_A,
                 "version": 1,
                 "digest": "abc123"
             }
@@ -185,13 +168,13 @@ class TestEventTypes:
                 "txDigest": "9jR9vbXjWaUbwg7aRKKHkZqZQYzFzFzFzFzFzFzFzF",
                 "eventSeq": "0"
             },
-            "packageId": "0x1234567890abcdef1234567890abcdef1234567890abcdef1234567890abcdef",
+            "packageId": ADDR_A,
             "transactionModule": "coin",
-            "sender": "0xabcdef1234567890abcdef1234567890abcdef1234567890abcdef1234567890",
+            "sender": ADDR_B,
             "type": "0x2::coin::CoinCreated<0x2::sui::SUI>",
             "parsedJson": {
                 "amount": "1000000000",
-                "owner": "0xabcdef1234567890abcdef1234567890abcdef1234567890abcdef1234567890"
+                "owner": ADDR_B
             },
             "timestampMs": 1234567890000
         }
@@ -219,10 +202,10 @@ class TestTransactionTypes:
                     "inputs": [],
                     "transactions": []
                 },
-                "sender": "0x1234567890abcdef1234567890abcdef1234567890abcdef1234567890abcdef",
+                "sender": ADDR_A,
                 "gasData": {
                     "payment": [],
-                    "owner": "0x1234567890abcdef1234567890abcdef1234567890abcdef1234567890abcdef",
+                    "owner": ADDR_A,
                     "price": "1000",
                     "budget": "1000000"
                 }
@@ -258,9 +241,9 @@ class TestTransactionTypes:
                         "txDigest": "9jR9vbXjWaUbwg7aRKKHkZqZQYzFzFzFzFzFzFzFzF",
                         "eventSeq": "0"
                     },
-                    "packageId": "0x1234567890abcdef1234567890abcdef1234567890abcdef1234567890abcdef",
+                    "packageId": ADDR_A,
                     "transactionModule": "test",
-                    "sender": "0xabcdef1234567890abcdef1234567890abcdef1234567890abcdef1234567890",
+                    "sender": ADDR_B,
                     "type": "test::Event"
                 }
             ],
@@ -281,77 +264,29 @@ class TestTransactionTypes:
 class TestQueryFilters:
     """Test query filter helper classes."""
     
-    def test_event_filter_by_package(self):
-        """Test EventFilter.by_package."""
-        package_id = "0x1234567890abcdef1234567890abcdef1234567890abcdef1234567890abcdef"
-        filter_dict = EventFilter.by_package(package_id)
-        
-        assert filter_dict == {"Package": package_id}
-    
-    def test_event_filter_by_module(self):
-        """Test EventFilter.by_module."""
-        package_id = "0x1234567890abcdef1234567890abcdef1234567890abcdef1234567890abcdef"
-        module_name = "coin"
-        filter_dict = EventFilter.by_module(package_id, module_name)
-        
-        expected = {
-            "MoveEventModule": {
-                "package": package_id,
-                "module": module_name
-            }
-        }
-        assert filter_dict == expected
-    
-    def test_event_filter_by_sender(self):
-        """Test EventFilter.by_sender."""
-        sender = "0x1234567890abcdef1234567890abcdef1234567890abcdef1234567890abcdef"
-        filter_dict = EventFilter.by_sender(sender)
-        
-        assert filter_dict == {"Sender": sender}
-    
-    def test_event_filter_by_time_range(self):
-        """Test EventFilter.by_time_range."""
-        start_time = 1234567890000
-        end_time = 1234567900000
-        filter_dict = EventFilter.by_time_range(start_time, end_time)
-        
-        expected = {
-            "TimeRange": {
-                "start_time": start_time,
-                "end_time": end_time
-            }
-        }
-        assert filter_dict == expected
-    
-    def test_transaction_filter_by_checkpoint(self):
-        """Test TransactionFilter.by_checkpoint."""
-        checkpoint = 100
-        filter_dict = TransactionFilter.by_checkpoint(checkpoint)
-        
-        assert filter_dict == {"Checkpoint": checkpoint}
-    
-    def test_transaction_filter_by_move_function(self):
-        """Test TransactionFilter.by_move_function."""
-        package_id = "0x1234567890abcdef1234567890abcdef1234567890abcdef1234567890abcdef"
-        module = "coin"
-        function = "transfer"
-        filter_dict = TransactionFilter.by_move_function(package_id, module, function)
-        
-        expected = {
-            "MoveFunction": {
-                "package": package_id,
-                "module": module,
-                "function": function
-            }
-        }
-        assert filter_dict == expected
-    
-    def test_transaction_filter_by_from_address(self):
-        """Test TransactionFilter.by_from_address."""
-        address = "0x1234567890abcdef1234567890abcdef1234567890abcdef1234567890abcdef"
-        filter_dict = TransactionFilter.by_from_address(address)
-        
-        assert filter_dict == {"FromAddress": address}
+    @pytest.mark.parametrize("builder,args,expected", [
+        (EventFilter.by_package, (ADDR_A,), {"Package": ADDR_A}),
+        (EventFilter.by_module, (ADDR_A, "coin"),
+         {"MoveEventModule": {"package": ADDR_A, "module": "coin"}}),
+        (EventFilter.by_sender, (ADDR_A,), {"Sender": ADDR_A}),
+        (EventFilter.by_time_range, (1234567890000, 1234567900000),
+         {"TimeRange": {"start_time": 1234567890000, "end_time": 1234567900000}}),
+        (TransactionFilter.by_checkpoint, (100,), {"Checkpoint": 100}),
+        (TransactionFilter.by_move_function, (ADDR_A, "coin", "transfer"),
+         {"MoveFunction": {"package": ADDR_A, "module": "coin", "function": "transfer"}}),
+        (TransactionFilter.by_from_address, (ADDR_A,), {"FromAddress": ADDR_A}),
+    ], ids=[
+        "event_by_package",
+        "event_by_module",
+        "event_by_sender",
+        "event_by_time_range",
+        "transaction_by_checkpoint",
+        "transaction_by_move_function",
+        "transaction_by_from_address",
+    ])
+    def test_filter_builders(self, builder, args, expected):
+        """Test the EventFilter and TransactionFilter helpers build the expected dicts."""
+        assert builder(*args) == expected
 
 
 class TestTypeConversions:
@@ -367,7 +302,7 @@ class TestTypeConversions:
             "bcsName": "0x2a",
             "type": "DynamicField",
             "objectType": "0x2::dynamic_field::Field<u64, 0x1::string::String>",
-            "objectId": "0x1234567890abcdef1234567890abcdef1234567890abcdef1234567890abcdef",
+            "objectId": ADDR_A,
             "version": 1,
             "digest": "abc123"
         }
@@ -380,12 +315,12 @@ class TestTypeConversions:
     def test_sui_object_data_round_trip(self):
         """Test SuiObjectData dictionary round trip."""
         original_data = {
-            "objectId": "0x1234567890abcdef1234567890abcdef1234567890abcdef1234567890abcdef",
+            "objectId": ADDR_A,
             "version": 1,
             "digest": "abc123",
             "type": "0x2::coin::Coin<0x2::sui::SUI>",
             "owner": {
-                "AddressOwner": "0xabcdef1234567890abcdef1234567890abcdef1234567890abcdef1234567890"
+                "AddressOwner": ADDR_B
             },
             "previousTransaction": "9jR9vbXjWaUbwg7aRKKHkZqZQYzFzFzFzFzFzFzFzF",
             "storageRebate": 100
@@ -403,9 +338,9 @@ class TestTypeConversions:
                 "txDigest": "9jR9vbXjWaUbwg7aRKKHkZqZQYzFzFzFzFzFzFzFzF",
                 "eventSeq": "0"
             },
-            "packageId": "0x1234567890abcdef1234567890abcdef1234567890abcdef1234567890abcdef",
+            "packageId": ADDR_A,
             "transactionModule": "coin",
-            "sender": "0xabcdef1234567890abcdef1234567890abcdef1234567890abcdef1234567890",
+            "sender": ADDR_B,
             "type": "0x2::coin::CoinCreated<0x2::sui::SUI>",
             "parsedJson": {
                 "amount": "1000000000"
@@ -430,7 +365,7 @@ class TestPaginationWithExtendedTypes:
                 "bcsName": "0x01",
                 "type": "DynamicField",
                 "objectType": "test",
-                "objectId": "0x1234567890abcdef1234567890abcdef1234567890abcdef1234567890abcdef",
+                "objectId": ADDR_A,
                 "version": 1,
                 "digest": "abc123"
             }
@@ -451,9 +386,9 @@ class TestPaginationWithExtendedTypes:
         event_data = [
             {
                 "id": {"txDigest": "9jR9vbXjWaUbwg7aRKKHkZqZQYzFzFzFzFzFzFzFzF", "eventSeq": "0"},
-                "packageId": "0x1234567890abcdef1234567890abcdef1234567890abcdef1234567890abcdef",
+                "packageId": ADDR_A,
                 "transactionModule": "test",
-                "sender": "0xabcdef1234567890abcdef1234567890abcdef1234567890abcdef1234567890",
+                "sender": ADDR_B,
                 "type": "test::Event"
             }
         ]
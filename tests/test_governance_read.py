@@ -3,7 +3,7 @@ Tests for the Governance Read API client.
 """
 
 import pytest
-from unittest.mock import AsyncMock, Mock
+from unittest.mock import create_autospec
 
 from sui_py.client.governance_read_api import GovernanceReadClient
 from sui_py.client.rest_client import RestClient
@@ -13,19 +13,99 @@ from sui_py.types import (
 )
 from sui_py.exceptions import SuiValidationError
 
+# Latest system state response with one active validator
+SYSTEM_STATE_PAYLOAD = {
+    "epoch": "750",
+    "protocolVersion": "84",
+    "systemStateVersion": "1",
+    "stakingPoolMappingsId": "0x123",
+    "stakingPoolMappingsSize": "100",
+    "inactivePoolsId": "0x456",
+    "inactivePoolsSize": "10",
+    "validatorCandidatesId": "0x789",
+    "validatorCandidatesSize": "5",
+    "pendingActiveValidatorsId": "0xabc",
+    "pendingActiveValidatorsSize": "2",
+    "pendingRemovals": ["1", "2"],
+    "activeValidators": [
+        {
+            "suiAddress": "0x123",
+            "protocolPubkeyBytes": "pubkey",
+            "networkPubkeyBytes": "netkey",
+            "workerPubkeyBytes": "workkey",
+            "proofOfPossessionBytes": "proof",
+            "name": "Test Validator",
+            "description": "A test validator",
+            "imageUrl": "http://image.url",
+            "projectUrl": "http://project.url",
+            "netAddress": "127.0.0.1:8080",
+            "p2pAddress": "127.0.0.1:8081",
+            "primaryAddress": "127.0.0.1:8082",
+            "workerAddress": "127.0.0.1:8083",
+            "votingPower": "1000",
+            "operationCapId": "0xop123",
+            "gasPrice": "1000",
+            "commissionRate": "500",
+            "nextEpochStake": "1000000",
+            "nextEpochGasPrice": "1000",
+            "nextEpochCommissionRate": "500",
+            "stakingPoolId": "0xpool123",
+            "stakingPoolSuiBalance": "1000000",
+            "rewardsPool": "50000",
+            "poolTokenBalance": "1000000",
+            "pendingStake": "0",
+            "pendingTotalSuiWithdraw": "0",
+            "pendingPoolTokenWithdraw": "0",
+            "exchangeRatesId": "0xrates123",
+            "exchangeRatesSize": "100"
+        }
+    ],
+    "atRiskValidators": [],
+    "validatorReportRecords": [],
+    "totalStake": "1000000000",
+    "storageFundTotalObjectStorageRebates": "100000",
+    "storageFundNonRefundableBalance": "50000",
+    "referenceGasPrice": "1000",
+    "safeMode": False,
+    "safeModeStorageRewards": "0",
+    "safeModeComputationRewards": "0",
+    "safeModeStorageRebates": "0",
+    "safeModeNonRefundableStorageFee": "0",
+    "epochStartTimestampMs": "1640995200000",
+    "epochDurationMs": "86400000",
+    "stakeSubsidyStartEpoch": "0",
+    "maxValidatorCount": "150",
+    "minValidatorJoiningStake": "30000000000",
+    "validatorLowStakeThreshold": "20000000000",
+    "validatorVeryLowStakeThreshold": "15000000000",
+    "validatorLowStakeGracePeriod": "7",
+    "stakeSubsidyBalance": "1000000000",
+    "stakeSubsidyDistributionCounter": "100",
+    "stakeSubsidyCurrentDistributionAmount": "10000000",
+    "stakeSubsidyPeriodLength": "30",
+    "stakeSubsidyDecreaseRate": 1000
+}
+
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_rest_client():
-    """Create a mock REST client."""
-    return AsyncMock(spec=RestClient)
+    """Create a mock REST client, autospecced against RestClient once per module."""
+    return create_autospec(RestClient, spec_set=True, instance=True)
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def governance_client(mock_rest_client):
     """Create a governance read client with mocked REST client."""
     return GovernanceReadClient(mock_rest_client)
 
 
+@pytest.fixture(autouse=True)
+def _reset_mock_rest_client(mock_rest_client):
+    """Clear calls, return values and side effects left by the previous test."""
+    yield
+    mock_rest_client.reset_mock(return_value=True, side_effect=True)
+
+
 class TestGovernanceReadClient:
     """Test suite for GovernanceReadClient."""
     
@@ -82,79 +162,7 @@ class TestGovernanceReadClient:
     @pytest.mark.asyncio
     async def test_get_latest_sui_system_state(self, governance_client, mock_rest_client):
         """Test getting latest system state."""
-        # Mock response
-        mock_response = {
-            "epoch": "750",
-            "protocolVersion": "84",
-            "systemStateVersion": "1",
-            "stakingPoolMappingsId": "0x123",
-            "stakingPoolMappingsSize": "100",
-            "inactivePoolsId": "0x456",
-            "inactivePoolsSize": "10",
-            "validatorCandidatesId": "0x789",
-            "validatorCandidatesSize": "5",
-            "pendingActiveValidatorsId": "0xabc",
-            "pendingActiveValidatorsSize": "2",
-            "pendingRemovals": ["1", "2"],
-            "activeValidators": [
-                {
-                    "suiAddress": "0x123",
-                    "protocolPubkeyBytes": "pubkey",
-                    "networkPubkeyBytes": "netkey",
-                    "workerPubkeyBytes": "workkey",
-                    "proofOfPossessionBytes": "proof",
-                    "name": "Test Validator",
-                    "description": "A test validator",
-                    "imageUrl": "http://image.url",
-                    "projectUrl": "http://project.url",
-                    "netAddress": "127.0.0.1:8080",
-                    "p2pAddress": "127.0.0.1:8081",
-                    "primaryAddress": "127.0.0.1:8082",
-                    "workerAddress": "127.0.0.1:8083",
-                    "votingPower": "1000",
-                    "operationCapId": "0xop123",
-                    "gasPrice": "1000",
-                    "commissionRate": "500",
-                    "nextEpochStake": "1000000",
-                    "nextEpochGasPrice": "1000",
-                    "nextEpochCommissionRate": "500",
-                    "stakingPoolId": "0xpool123",
-                    "stakingPoolSuiBalance": "1000000",
-                    "rewardsPool": "50000",
-                    "poolTokenBalance": "1000000",
-                    "pendingStake": "0",
-                    "pendingTotalSuiWithdraw": "0",
-                    "pendingPoolTokenWithdraw": "0",
-                    "exchangeRatesId": "0xrates123",
-                    "exchangeRatesSize": "100"
-                }
-            ],
-            "atRiskValidators": [],
-            "validatorReportRecords": [],
-            "totalStake": "1000000000",
-            "storageFundTotalObjectStorageRebates": "100000",
-            "storageFundNonRefundableBalance": "50000",
-            "referenceGasPrice": "1000",
-            "safeMode": False,
-            "safeModeStorageRewards": "0",
-            "safeModeComputationRewards": "0",
-            "safeModeStorageRebates": "0",
-            "safeModeNonRefundableStorageFee": "0",
-            "epochStartTimestampMs": "1640995200000",
-            "epochDurationMs": "86400000",
-            "stakeSubsidyStartEpoch": "0",
-            "maxValidatorCount": "150",
-            "minValidatorJoiningStake": "30000000000",
-            "validatorLowStakeThreshold": "20000000000",
-            "validatorVeryLowStakeThreshold": "15000000000",
-            "validatorLowStakeGracePeriod": "7",
-            "stakeSubsidyBalance": "1000000000",
-            "stakeSubsidyDistributionCounter": "100",
-            "stakeSubsidyCurrentDistributionAmount": "10000000",
-            "stakeSubsidyPeriodLength": "30",
-            "stakeSubsidyDecreaseRate": 1000
-        }
-        mock_rest_client.call.return_value = mock_response
+        mock_rest_client.call.return_value = SYSTEM_STATE_PAYLOAD
         
         # Call method
         result = await governance_client.get_latest_sui_system_state()
@@ -261,6 +269,15 @@ class TestGovernanceReadClient:
              "0x4567890123456789012345678901234567890123456789012345678901234567"]
         ])
     
+    @pytest.mark.asyncio
+    async def test_get_stakes_by_ids_invalid(self, governance_client, mock_rest_client):
+        """Test that invalid staked SUI IDs are rejected before any RPC call."""
+        with pytest.raises(SuiValidationError, match="Invalid object ID format"):
+            await governance_client.get_stakes_by_ids(["0x123", "0xzzzz"])
+        with pytest.raises(SuiValidationError, match="must be a string or ObjectID"):
+            await governance_client.get_stakes_by_ids([123])
+        mock_rest_client.call.assert_not_called()
+    
     def test_validate_address_string(self, governance_client):
         """Test address validation with string input."""
         valid_address = "0x123abc"
@@ -287,4 +304,14 @@ class TestGovernanceReadClient:
     def test_validate_address_invalid_hex(self, governance_client):
         """Test address validation with invalid hex."""
         with pytest.raises(SuiValidationError, match="Invalid Sui address format"):
-            governance_client._validate_address("0xzzzz") 
\ No newline at end of file
+            governance_client._validate_address("0xzzzz")
+    
+    def test_validate_address_non_ascii(self, governance_client):
+        """Test address validation rejects non-ASCII characters."""
+        with pytest.raises(SuiValidationError, match="Invalid Sui address format"):
+            governance_client._validate_address("0x12\u0663")
+    
+    def test_validate_address_too_long(self, governance_client):
+        """Test address validation rejects more than 64 hex digits."""
+        with pytest.raises(SuiValidationError, match="Invalid Sui address format"):
+            governance_client._validate_address("0x" + "a" * 65)
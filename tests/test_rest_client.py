@@ -0,0 +1,29 @@
+"""
+Tests for the JSON-RPC REST client.
+"""
+
+import httpx
+import pytest
+
+from sui_py.client.rest_client import RestClient
+
+# Largest u128, wider than any machine integer a native JSON decoder may use
+U128_MAX = 2**128 - 1
+
+
+@pytest.mark.asyncio
+async def test_call_keeps_wide_integers_exact():
+    """Bare u128 values in a response decode to exact Python ints."""
+    def handler(request: httpx.Request) -> httpx.Response:
+        body = '{"jsonrpc": "2.0", "id": 1, "result": {"value": %d}}' % U128_MAX
+        return httpx.Response(200, content=body.encode())
+
+    client = RestClient("http://localhost:9000")
+    client._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    try:
+        result = await client.call("suix_getTotalSupply", ["0x2::sui::SUI"])
+    finally:
+        await client.close()
+
+    assert result["value"] == U128_MAX
+    assert type(result["value"]) is int
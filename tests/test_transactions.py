@@ -6,811 +6,189 @@ This module tests the transaction building and serialization system,
 replicating test cases from the C# Sui Unity SDK for cross-language validation.
 """
 
+import logging
+import re
 import pytest
-import sys
-import os
 
-# Add the parent directory to the path to import sui_py
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import base58
 
 from sui_py import TransactionBuilder
-from sui_py.bcs import serialize
-from sui_py.types import SuiAddress, ObjectRef
-from sui_py.transactions import (
-    ProgrammableTransactionBlock, 
-    MoveCall,
-    ObjectArgument,
-    PureArgument,
-    ResultArgument,
-    TransferObjects,
-    # Complete transaction data structures
-    TransactionData,
-    TransactionDataV1, 
-    TransactionType,
-    GasData,
-    TransactionExpiration,
-    TransactionKind,
-    TransactionKindType
-)
-from sui_py.transactions.commands import (
-    Command, TransactionArgument, MoveCall
-)
-from sui_py.transactions.arguments import (
-    InputArgument
-)
+from tests.test_data import load_bytes
+
+log = logging.getLogger(__name__)
+
+# Expected transaction bytes from the C# TransactionDataSerializationSingleInput test
+EXPECTED_SINGLE_INPUT = load_bytes("transactions/expected_single_input.bin")
+
+# Module, function and type names that every display::new call must carry
+_NEEDLE_RE = re.compile(b"display|new|capy|Capy")
+_NEEDLES = frozenset((b"display", b"new", b"capy", b"Capy"))
+
+
+def _found_needles(data: bytes) -> set:
+    """Return which of the expected names occur in data, in a single scan."""
+    return {m.group() for m in _NEEDLE_RE.finditer(data)}
+
+
+def _assert_move_call_bytes(serialized: bytes) -> None:
+    """Assert a serialized display::new Move call is non-empty and names its target."""
+    assert len(serialized) > 0
+    assert _found_needles(serialized) >= _NEEDLES
+
+
+@pytest.fixture
+def fresh_builder():
+    """A new, empty TransactionBuilder for each test."""
+    return TransactionBuilder()
+
+
+# Fields of EXPECTED_SINGLE_INPUT at their fixed byte offsets, as
+# (name, offset, bytes); the first occurrence is used where a value repeats
+_EXPECTED_LAYOUT = [
+    ("Object ID", 5, bytes.fromhex("10" + "00" * 31)),
+    ("Version (10000)", 37, (10000).to_bytes(8, "little")),
+    ("'display'", 100, b"\x07display"),  # length(7) + "display"
+    ("'new'", 108, b"\x03new"),  # length(3) + "new"
+    ("'Capy'", 151, b"\x04Capy\x00"),  # length(4) + "Capy" + empty type args
+    ("Sender address", 161, bytes.fromhex("00" * 30 + "0bad")),
+    ("Gas budget (1000000)", 295, (1000000).to_bytes(8, "little")),
+]
+
+
+# Argument factories for test_transaction_builder_equivalence; each takes the
+# builder and the (object ID, version, digest) of the C# object and returns
+# the Move call arguments
+def _single_object_args(tx: TransactionBuilder, object_ref: tuple) -> list:
+    """Single object input."""
+    return [tx.object(*object_ref)]
+
+
+def _repeated_object_args(tx: TransactionBuilder, object_ref: tuple) -> list:
+    """The same object passed twice, reusing the first reference."""
+    obj = tx.object(*object_ref)
+    return [obj, obj]
+
+
+def _pure_args(tx: TransactionBuilder, object_ref: tuple) -> list:
+    """A single pure u64 argument."""
+    return [tx.pure(1000, "u64")]
 
 
-@pytest.mark.skip(reason="TransactionBuilder requires RPC infrastructure not yet implemented")
 class TestTransactionSerialization:
     """
-    High-level TransactionBuilder tests - SKIPPED until RPC implementation
-    
-    These tests validate the high-level TransactionBuilder API against C# Unity SDK.
-    Currently skipped because TransactionBuilder requires:
-    - RPC client for object resolution
-    - Gas estimation via network calls  
-    - Live blockchain state access
-    
-    Enable these tests once RPC infrastructure is implemented.
+    High-level TransactionBuilder tests using the C# Unity SDK transaction values.
     
-    For low-level serialization testing (no RPC required), see:
-    tests/test_transactions_serialization.py
+    Objects are passed with a version and digest, so the PTBs build offline
+    without an RPC client. The byte-for-byte comparison of complete transaction
+    data with the C# vectors is in tests/test_transactions_serialization.py.
     """
     
-    def setup_method(self):
-        """Set up test data matching the C# test values."""
-        # Test addresses and values from C# test
-        self.test_address = "0x0000000000000000000000000000000000000000000000000000000000000BAD"
-        self.object_id = "0x1000000000000000000000000000000000000000000000000000000000000000"
-        self.version = 10000
-        self.digest = "1Bhh3pU9gLXZhoVxkr5wyg9sX6"
-        self.sui_address_hex = "0x0000000000000000000000000000000000000000000000000000000000000002"
-        
-        # Expected byte arrays from C# tests
-        self.expected_single_input = bytes([
-            0, 0, 1, 1, 0, 16, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 16, 39, 0, 0, 0, 0, 0, 0, 20, 0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 2, 7, 100, 105, 115, 112, 108, 97, 121, 3, 110, 101, 119, 1, 7, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 2, 4, 99, 97, 112, 121, 4, 67, 97, 112, 121, 0, 1, 1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 11, 173, 1, 16, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 16, 39, 0, 0, 0, 0, 0, 0, 20, 0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 2, 1, 0, 0, 0, 0, 0, 0, 0, 64, 66, 15, 0, 0, 0, 0, 0, 0 
-        ])
-        
-        self.expected_multiple_input = bytes([
-            0, 0, 1, 1, 0, 16, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 16, 39, 0, 0, 0, 0, 0, 0, 20, 0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 2, 7, 100, 105, 115, 112, 108, 97, 121, 3, 110, 101, 119, 1, 7, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 2, 4, 99, 97, 112, 121, 4, 67, 97, 112, 121, 0, 3, 1, 0, 0, 1, 1, 0, 2, 2, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 11, 173, 1, 16, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 16, 39, 0, 0, 0, 0, 0, 0, 20, 0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 2, 1, 0, 0, 0, 0, 0, 0, 0, 64, 66, 15, 0, 0, 0, 0, 0, 0
-        ])
+    # Object ID and version from the C# test. Its digest is a 20-byte mock that
+    # ObjectRef rejects, so a 32-byte digest stands in for it
+    object_id = "0x1000000000000000000000000000000000000000000000000000000000000000"
+    version = 10000
+    digest = base58.b58encode(bytes(range(32))).decode()
+    object_ref = (object_id, version, digest)
+    sui_address_hex = "0x0000000000000000000000000000000000000000000000000000000000000002"
+    target = f"{sui_address_hex}::display::new"
+    type_argument = f"{sui_address_hex}::capy::Capy"
     
-    def test_transaction_data_serialization_single_input(self):
-        """
-        Test transaction data serialization with single input.
-        
-        Equivalent to C# TransactionDataSerializationSingleInput test.
-        """
-        # Create exact structures from C# test
-        
-        # Create payment object ref (from C# test)
-        payment_ref = ObjectRef(
-            object_id=self.object_id,
-            version=self.version, 
-            digest=self.digest
-        )
-        
-        # Create gas data (from C# test values)
-        gas_data = GasData(
-            budget="1000000",
-            price="1", 
-            payment=[payment_ref],
-            owner=SuiAddress(self.sui_address_hex)
-        )
-        
-        # Use TransactionBuilder to correctly handle argument indexing
-        tx = TransactionBuilder()
-        payment_obj = tx.object(self.object_id, self.version, self.digest)
-        
-        move_result = tx.move_call(
-            target=f"{self.sui_address_hex}::display::new",
-            arguments=[payment_obj],
-            type_arguments=[f"{self.sui_address_hex}::capy::Capy"]
-        )
-        
-        ptb = tx.build()
-        
-        # Create complete transaction data structure
-        transaction_kind = TransactionKind(
-            kind_type=TransactionKindType.ProgrammableTransaction,
-            programmable_transaction=ptb
-        )
-        
-        transaction_data_v1 = TransactionDataV1(
-            transaction_kind=transaction_kind,
-            sender=SuiAddress(self.test_address),
-            gas_data=gas_data,
-            expiration=TransactionExpiration()
-        )
-        
-        transaction_data = TransactionData(
-            transaction_type=TransactionType.V1,
-            transaction_data_v1=transaction_data_v1
-        )
-        
-        # Serialize complete transaction data
-        actual_bytes = serialize(transaction_data)
-        
-        print(f"Single input transaction serialized to {len(actual_bytes)} bytes")
-        print(f"Expected length: {len(self.expected_single_input)} bytes")
-        print(f"Actual:   {actual_bytes[:50].hex()}...")
-        print(f"Expected: {self.expected_single_input[:50].hex()}...")
-        
-        # Assert exact byte match with C# test expected output
-        assert actual_bytes == self.expected_single_input, (
-            f"Serialized bytes don't match expected C# output!\n"
-            f"Actual length: {len(actual_bytes)}\n"
-            f"Expected length: {len(self.expected_single_input)}\n"
-            f"Actual bytes:   {actual_bytes.hex()}\n"
-            f"Expected bytes: {self.expected_single_input.hex()}"
-        )
-    
-    def test_transaction_data_serialization_multiple_inputs(self):
-        """
-        Test transaction data serialization with multiple inputs.
-        
-        Equivalent to C# TransactionDataSerialization test.
-        This test has 1 PTB input but 3 MoveCall arguments: Input(0), Input(1), Result(2).
-        """
-        # Create exact structures from C# test
-        
-        # Create payment object ref (from C# test)
-        payment_ref = ObjectRef(
-            object_id=self.object_id,
-            version=self.version,
-            digest=self.digest
-        )
-        
-        # Create gas data (from C# test values)
-        gas_data = GasData(
-            budget="1000000",
-            price="1",
-            payment=[payment_ref],
-            owner=SuiAddress(self.sui_address_hex)
-        )
-        
-        # Build PTB manually to match C# test structure exactly
-        # C# creates: CallArg[] inputs = new CallArg[] { new CallArg(CallArgumentType.Object, new ObjectCallArg(...)) }
-        object_input = ObjectArgument(payment_ref)
-        
-        # C# creates: MoveCall with 3 arguments: Input(0), Input(1), Result(2)
-        
-        move_call = MoveCall(
-            package=self.sui_address_hex,
-            module="display", 
-            function="new",
-            arguments=[
-                InputArgument(0),  # TransactionArgument(Input, TransactionBlockInput(0))
-                InputArgument(1),  # TransactionArgument(Input, TransactionBlockInput(1))
-                ResultArgument(2)  # TransactionArgument(Result, Result(2)) - matches C# Result(2)
-            ],
-            type_arguments=[f"{self.sui_address_hex}::capy::Capy"]
-        )
-        
-        # Create PTB with exact structure from C# test
-        ptb = ProgrammableTransactionBlock(
-            inputs=[object_input],  # Only 1 PTB input
-            commands=[move_call]
-        )
-        
-        # Create complete transaction data structure
-        transaction_kind = TransactionKind(
-            kind_type=TransactionKindType.ProgrammableTransaction,
-            programmable_transaction=ptb
-        )
-        
-        transaction_data_v1 = TransactionDataV1(
-            transaction_kind=transaction_kind,
-            sender=SuiAddress(self.test_address),
-            gas_data=gas_data,
-            expiration=TransactionExpiration()
-        )
-        
-        transaction_data = TransactionData(
-            transaction_type=TransactionType.V1,
-            transaction_data_v1=transaction_data_v1
-        )
-        
-        # Serialize complete transaction data
-        actual_bytes = serialize(transaction_data)
-        
-        print(f"Multiple input transaction serialized to {len(actual_bytes)} bytes")
-        print(f"Expected length: {len(self.expected_multiple_input)} bytes")
-        print(f"Actual:   {actual_bytes[:50].hex()}...")
-        print(f"Expected: {self.expected_multiple_input[:50].hex()}...")
-        
-        # Verify basic properties
-        assert len(actual_bytes) > 0
-        assert isinstance(actual_bytes, bytes)
-        
-        # Verify key components are present in serialized data
-        assert b"display" in actual_bytes
-        assert b"new" in actual_bytes
-        assert b"capy" in actual_bytes
-        assert b"Capy" in actual_bytes
-        
-        # Assert exact byte match with C# test expected output
-        assert actual_bytes == self.expected_multiple_input, (
-            f"Serialized bytes don't match expected C# output!\n"
-            f"Actual length: {len(actual_bytes)}\n"
-            f"Expected length: {len(self.expected_multiple_input)}\n"
-            f"Actual bytes:   {actual_bytes.hex()}\n"
-            f"Expected bytes: {self.expected_multiple_input.hex()}"
-        )
-    
-    def test_move_call_pattern_matching(self):
+    @pytest.mark.asyncio
+    async def test_move_call_pattern_matching(self, fresh_builder):
         """
         Test that our Move call pattern matches the C# structure.
         
         This test focuses on the Move call serialization pattern specifically.
         """
-        tx = TransactionBuilder()
-        
-        # Create the exact Move call pattern from C# test
-        obj_input = tx.object(self.object_id)
-        
-        move_result = tx.move_call(
-            target=f"{self.sui_address_hex}::display::new",
-            arguments=[obj_input],
-            type_arguments=[f"{self.sui_address_hex}::capy::Capy"]
+        tx = fresh_builder
+        tx.move_call(
+            target=self.target,
+            arguments=[tx.object(*self.object_ref)],
+            type_arguments=[self.type_argument]
         )
-        
-        ptb = tx.build()
+        ptb = await tx.build_ptb()
         
         # Verify the PTB structure
         assert len(ptb.inputs) == 1  # Single object input
         assert len(ptb.commands) == 1  # Single Move call command
         
-        # Verify the command is a Move call
-        command = ptb.commands[0]
-        assert hasattr(command, 'package')
-        assert hasattr(command, 'module')
-        assert hasattr(command, 'function')
-        
-        # Verify the values match what we expect
+        # Verify the command is a Move call with the expected target
+        command = ptb.commands[0].data
         assert command.module == "display"
         assert command.function == "new"
         
-        # Serialize and verify key patterns
+        # Should contain the module, function and type names
         serialized = ptb.to_bytes()
+        _assert_move_call_bytes(serialized)
         
-        # Should contain the module and function names
-        assert b"display" in serialized
-        assert b"new" in serialized
-        assert b"capy" in serialized  
-        assert b"Capy" in serialized
-        
-        print(f"Move call pattern test passed, {len(serialized)} bytes serialized")
+        log.debug("Move call pattern serialized to %d bytes", len(serialized))
     
-    def test_transaction_builder_equivalence(self):
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("setup", [
+        _single_object_args,
+        _repeated_object_args,
+        _pure_args,
+    ], ids=["single_object", "multiple_objects", "pure_arg"])
+    async def test_transaction_builder_equivalence(self, setup, fresh_builder):
         """
         Test that our TransactionBuilder produces equivalent structure to C# transaction data.
         """
-        # Test with known values
-        tx = TransactionBuilder()
-        
-        # Test multiple scenarios
-        scenarios = [
-            # Single object input
-            {
-                "name": "single_object",
-                "setup": lambda tx: tx.object(self.object_id),
-                "expected_inputs": 1
-            },
-            # Multiple object inputs  
-            {
-                "name": "multiple_objects",
-                "setup": lambda tx: [tx.object(self.object_id), tx.object(self.object_id)],
-                "expected_inputs": 2  # Should deduplicate to 1 actually
-            },
-            # Pure argument
-            {
-                "name": "pure_arg",
-                "setup": lambda tx: tx.pure(1000, "u64"),
-                "expected_inputs": 1
-            }
-        ]
-        
-        for scenario in scenarios:
-            tx = TransactionBuilder()
-            args = scenario["setup"](tx)
-            
-            # Ensure args is a list
-            if not isinstance(args, list):
-                args = [args]
-            
-            # Create a Move call with the arguments
-            move_result = tx.move_call(
-                target=f"{self.sui_address_hex}::display::new",
-                arguments=args,
-                type_arguments=[f"{self.sui_address_hex}::capy::Capy"]
-            )
-            
-            ptb = tx.build()
-            serialized = ptb.to_bytes()
-            
-            print(f"Scenario '{scenario['name']}': {len(ptb.inputs)} inputs, {len(serialized)} bytes")
-            
-            # Basic validation
-            assert len(ptb.commands) >= 1
-            assert len(serialized) > 0
-
-    def test_debug_serialization_components(self):
-        """Debug test to analyze serialization components step by step."""
-        print("\n=== DEBUG SERIALIZATION ===")
-        
-        # Test individual components
-        sender = SuiAddress(self.test_address)
-        print(f"Sender serialized: {serialize(sender).hex()}")
-        
-        expiration = TransactionExpiration()
-        print(f"Expiration serialized: {serialize(expiration).hex()}")
-        
-        payment_ref = ObjectRef(
-            object_id=self.object_id,
-            version=self.version,
-            digest=self.digest
-        )
-        print(f"Payment ref serialized: {serialize(payment_ref).hex()}")
+        tx = fresh_builder
+        args = setup(tx, self.object_ref)
         
-        gas_data = GasData(
-            budget="1000000",
-            price="1",
-            payment=[payment_ref],
-            owner=SuiAddress(self.sui_address_hex)
+        # Create a Move call with the arguments
+        tx.move_call(
+            target=self.target,
+            arguments=args,
+            type_arguments=[self.type_argument]
         )
-        print(f"Gas data serialized: {serialize(gas_data).hex()}")
         
-        # Compare with expected pattern
-        expected_hex = self.expected_single_input.hex()
-        print(f"Expected start: {expected_hex[:100]}")
-        
-        # Build minimal transaction for comparison
-        from sui_py.bcs import Serializer
-        serializer = Serializer()
-        
-        # Try serializing in the exact order we think it should be
-        print("\n=== STEP BY STEP ===")
-        serializer.write_u8(0)  # Transaction type V1
-        print(f"After transaction type: {serializer.to_bytes().hex()}")
-        
-        sender.serialize(serializer)
-        print(f"After sender: {serializer.to_bytes().hex()}")
-        
-        expiration.serialize(serializer)
-        print(f"After expiration: {serializer.to_bytes().hex()}")
-        
-        assert True  # Always pass for debug
-
-    def test_ptb_serialization_only(self):
-        """Test that our PTB serialization matches the embedded part in expected bytes."""
-        print("\n=== PTB ONLY TEST ===")
-        
-        # Build the same PTB as in the C# test
-        tx = TransactionBuilder()
-        payment_obj = tx.object(self.object_id)
-        
-        move_result = tx.move_call(
-            target=f"{self.sui_address_hex}::display::new",
-            arguments=[payment_obj],
-            type_arguments=[f"{self.sui_address_hex}::capy::Capy"]
-        )
-        
-        ptb = tx.build()
-        ptb_bytes = ptb.to_bytes()
-        
-        print(f"PTB serialized: {ptb_bytes.hex()}")
-        print(f"PTB length: {len(ptb_bytes)} bytes")
-        
-        # The PTB should be embedded somewhere in the expected bytes
-        expected_hex = self.expected_single_input.hex()
-        ptb_hex = ptb_bytes.hex()
-        
-        # Look for our PTB pattern in the expected bytes
-        if "display" in str(self.expected_single_input):
-            print("✓ 'display' found in expected bytes")
-        
-        # Check if our move call structure appears in expected bytes
-        # The expected bytes should contain: 02 (package), 07 "display", 03 "new", etc.
-        display_pattern = "07646973706c6179"  # length(7) + "display" 
-        new_pattern = "036e6577"              # length(3) + "new"
-        capy_pattern = "044361707900"         # length(4) + "Capy" + empty type args
-        
-        if display_pattern in expected_hex:
-            print("✓ 'display' pattern found in expected bytes")
-        if new_pattern in expected_hex:
-            print("✓ 'new' pattern found in expected bytes") 
-        if capy_pattern in expected_hex:
-            print("✓ 'Capy' pattern found in expected bytes")
-        
-        # Compare our PTB bytes with the known patterns
-        if display_pattern in ptb_hex:
-            print("✓ 'display' pattern found in our PTB")
-        if new_pattern in ptb_hex:
-            print("✓ 'new' pattern found in our PTB")
-            
-        assert True  # Always pass for debug
-
-    def test_reverse_engineer_structure(self):
-        """Reverse engineer the exact byte structure from expected bytes."""
-        print("\n=== REVERSE ENGINEERING ===")
-        
-        expected = self.expected_single_input
-        expected_hex = expected.hex()
-        
-        print(f"Expected total length: {len(expected)} bytes")
-        print(f"Expected hex: {expected_hex}")
-        print()
-        
-        # Analyze the structure byte by byte
-        print("Byte analysis:")
-        print(f"Byte 0: {expected[0]:02x} - Transaction type (0 = V1) ✓")
-        print(f"Byte 1: {expected[1]:02x} - ?")
-        print(f"Byte 2: {expected[2]:02x} - ?") 
-        print(f"Byte 3: {expected[3]:02x} - ?")
-        print(f"Bytes 0-3: {expected_hex[:8]} - First 4 bytes")
-        print()
-        
-        # Look for the sender address (should be 32 bytes of our test address)
-        sender_hex = "0000000000000000000000000000000000000000000000000000000000000bad"
-        if sender_hex in expected_hex:
-            start_pos = expected_hex.find(sender_hex) // 2
-            print(f"✓ Sender address found at byte {start_pos}")
-            print(f"  Before sender: {expected_hex[:start_pos*2]}")
-        
-        # Look for PTB content markers
-        display_pos = expected_hex.find("07646973706c6179") // 2  # "display"
-        if display_pos >= 0:
-            print(f"✓ 'display' found at byte {display_pos}")
-            
-        new_pos = expected_hex.find("036e6577") // 2  # "new"
-        if new_pos >= 0:
-            print(f"✓ 'new' found at byte {new_pos}")
-            
-        # Try to find the gas budget (1000000 = 0x0F4240)
-        gas_pattern = "40420f00000000"  # 1000000 as little-endian u64
-        gas_pos = expected_hex.find(gas_pattern) // 2
-        if gas_pos >= 0:
-            print(f"✓ Gas budget (1000000) found at byte {gas_pos}")
-        
-        # Try different gas patterns
-        gas_pattern2 = "00000000000f4240"  # 1000000 as big-endian u64
-        gas_pos2 = expected_hex.find(gas_pattern2) // 2 
-        if gas_pos2 >= 0:
-            print(f"✓ Gas budget (big-endian) found at byte {gas_pos2}")
-            
-        # Look for object ID pattern 
-        obj_pattern = "1000000000000000000000000000000000000000000000000000000000000000"
-        obj_pos = expected_hex.find(obj_pattern) // 2
-        if obj_pos >= 0:
-            print(f"✓ Object ID found at byte {obj_pos}")
-            
-        # Look for version (10000 = 0x2710)
-        version_pattern = "1027000000000000"  # 10000 as little-endian u64
-        version_pos = expected_hex.find(version_pattern) // 2
-        if version_pos >= 0:
-            print(f"✓ Version (10000) found at byte {version_pos}")
-            
-        assert True  # Always pass for debug
-
-    def test_ptb_byte_comparison(self):
-        """Compare our PTB serialization with the embedded PTB in expected bytes."""
-        print("\n=== PTB BYTE COMPARISON ===")
-        
-        # Build the PTB exactly like in C# test
-        tx = TransactionBuilder()
-        payment_obj = tx.object(self.object_id)
-        
-        move_result = tx.move_call(
-            target=f"{self.sui_address_hex}::display::new",
-            arguments=[payment_obj],
-            type_arguments=[f"{self.sui_address_hex}::capy::Capy"]
-        )
-        
-        ptb = tx.build()
-        our_ptb_bytes = ptb.to_bytes()
-        
-        print(f"Our PTB length: {len(our_ptb_bytes)} bytes")
-        print(f"Our PTB hex: {our_ptb_bytes.hex()}")
-        print()
-        
-        # Extract PTB from expected bytes (should be bytes 1-159 based on reverse engineering)
-        # But let's be more precise - the sender starts at byte 160, so PTB should be bytes 1-159
-        expected_hex = self.expected_single_input.hex()
-        
-        # PTB starts after transaction type (byte 0) and ends before sender (byte 160)
-        expected_ptb_bytes = self.expected_single_input[1:160]  # bytes 1-159
-        print(f"Expected PTB length: {len(expected_ptb_bytes)} bytes")
-        print(f"Expected PTB hex: {expected_ptb_bytes.hex()}")
-        print()
-        
-        # Compare byte by byte
-        min_length = min(len(our_ptb_bytes), len(expected_ptb_bytes))
-        print(f"Comparing first {min_length} bytes:")
-        
-        differences = []
-        for i in range(min_length):
-            if our_ptb_bytes[i] != expected_ptb_bytes[i]:
-                differences.append((i, our_ptb_bytes[i], expected_ptb_bytes[i]))
-        
-        if differences:
-            print(f"Found {len(differences)} differences:")
-            for i, (pos, actual, expected) in enumerate(differences[:10]):  # Show first 10 differences
-                print(f"  Byte {pos}: actual={actual:02x}, expected={expected:02x}")
-        else:
-            print("✓ All compared bytes match!")
-            
-        if len(our_ptb_bytes) != len(expected_ptb_bytes):
-            print(f"❌ Length difference: our={len(our_ptb_bytes)}, expected={len(expected_ptb_bytes)}")
-        else:
-            print("✓ Lengths match!")
-            
-        assert True  # Always pass for debug
-
-    def test_object_ref_serialization(self):
-        """Test ObjectRef serialization to match C# SuiObjectRef."""
-        print("\n=== OBJECT REF SERIALIZATION ===")
-        
-        # Create the exact ObjectRef from C# test
-        payment_ref = ObjectRef(
-            object_id=self.object_id,
-            version=self.version,
-            digest=self.digest
-        )
-        
-        ref_bytes = serialize(payment_ref)
-        print(f"ObjectRef serialized: {ref_bytes.hex()}")
-        print(f"ObjectRef length: {len(ref_bytes)} bytes")
-        
-        # Look for the known patterns in expected bytes
-        expected_hex = self.expected_single_input.hex()
-        ref_hex = ref_bytes.hex()
-        
-        # Object ID should be the first 32 bytes (64 hex chars)
-        expected_obj_id = "1000000000000000000000000000000000000000000000000000000000000000"
-        if expected_obj_id in ref_hex:
-            print("✓ Object ID found in serialized ObjectRef")
-        
-        # Version should be 10000 = 0x2710 as little-endian u64 = 1027000000000000
-        expected_version = "1027000000000000"
-        if expected_version in ref_hex:
-            print("✓ Version (10000) found in serialized ObjectRef")
-        else:
-            print(f"❌ Version pattern not found. Looking for: {expected_version}")
-            
-        # Check if this pattern appears in the expected bytes
-        if expected_version in expected_hex:
-            pos = expected_hex.find(expected_version) // 2
-            print(f"✓ Version pattern found in expected bytes at position {pos}")
+        ptb = await tx.build_ptb()
+        serialized = ptb.to_bytes()
         
-        # Let's also check the digest
-        digest_bytes = self.digest.encode('utf-8')
-        digest_hex = digest_bytes.hex()
-        print(f"Digest '{self.digest}' as hex: {digest_hex}")
+        log.debug("%d inputs, %d bytes", len(ptb.inputs), len(serialized))
         
-        if digest_hex in ref_hex:
-            print("✓ Digest found in serialized ObjectRef")
-            
-        assert True  # Always pass for debug
+        # Repeated objects share one input
+        assert len(ptb.inputs) == 1
+        assert len(ptb.commands) == 1
+        _assert_move_call_bytes(serialized)
 
-    def test_digest_encoding_analysis(self):
-        """Analyze how the digest should be encoded based on expected bytes."""
-        print("\n=== DIGEST ENCODING ANALYSIS ===")
-        
-        digest = self.digest  # "1Bhh3pU9gLXZhoVxkr5wyg9sX6"
-        print(f"Original digest: '{digest}'")
-        
-        # Check the bytes around position 44 in expected
-        expected_bytes = self.expected_single_input
-        bytes_44_64 = expected_bytes[44:64]
-        print(f"Expected bytes 44-64: {bytes_44_64.hex()}")
-        print(f"Expected bytes 44-64 as bytes: {list(bytes_44_64)}")
-        
-        # Interpret this as a length-prefixed string
-        if len(bytes_44_64) > 0:
-            length = bytes_44_64[0]
-            print(f"First byte (length?): {length}")
-            if length > 0 and length < len(bytes_44_64):
-                content = bytes_44_64[1:length+1]
-                print(f"Content bytes: {content}")
-                try:
-                    content_str = content.decode('utf-8')
-                    print(f"Content as string: '{content_str}'")
-                except:
-                    print("Content is not valid UTF-8")
-        
-        # Let's try different digest encodings
-        print("\nDifferent digest encodings:")
-        
-        # UTF-8 bytes
-        utf8_bytes = digest.encode('utf-8')
-        print(f"UTF-8: {utf8_bytes.hex()}")
-        
-        # Try base64 decode (since digest might be base64)
-        try:
-            import base64
-            decoded = base64.b64decode(digest + '==')  # Add padding if needed
-            print(f"Base64 decoded: {decoded.hex()}")
-        except:
-            print("Not valid base64")
-            
-        # Try base58 decode (common in blockchain)
-        try:
-            import base58
-            decoded = base58.b58decode(digest)
-            print(f"Base58 decoded: {decoded.hex()}")
-        except:
-            print("Not valid base58 (or base58 not available)")
-            
-        # Let's see if the pattern 000102030405060708090001020304050607080900 matches anything
-        mystery_pattern = bytes([0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 0])
-        print(f"Mystery pattern: {mystery_pattern.hex()}")
-        print(f"Mystery pattern length: {len(mystery_pattern)}")
-        
-        assert True  # Always pass for debug
 
-    def test_manual_ptb_construction(self):
-        """Manually construct PTB to match C# expected bytes exactly."""
-        print("\n=== MANUAL PTB CONSTRUCTION ===")
-        
-        # Based on analysis, the C# test seems to use mock data
-        # Let's try to construct the exact PTB that would produce the expected bytes
-        
-        from sui_py.bcs import Serializer
-        
-        # Try to manually serialize what the C# test expects
-        serializer = Serializer()
-        
-        # Based on expected bytes analysis:
-        # - Expected PTB starts at byte 1, length 159 bytes
-        # - It should contain: inputs sequence, commands sequence
-        
-        # Let's try to manually build the inputs section first
-        # The expected starts with: 00 01 01 00 10 00 00 ...
-        # This might be:
-        # - 00: sequence length for inputs (0 inputs?)
-        # - 01: sequence length for commands (1 command)
-        # - 01: command type 
-        # - 00: move call variant
-        # - 10 00 00 ...: the object id
-        
-        # Wait, let me re-interpret. Looking at byte-by-byte:
-        # Expected PTB bytes: 00 01 01 00 10 00 00 ...
-        # This could be:
-        # - 00: Could this be sequence length of inputs? (But C# test has 1 input)
-        # - This doesn't match. Let me look at the C# serialization differently.
-        
-        expected_ptb = self.expected_single_input[1:160]  # Extract PTB portion
-        print(f"Expected PTB: {expected_ptb.hex()}")
-        
-        # Let's try a different approach - look at the exact C# CallArg structure
-        # and see if our implementation matches
-        
-        # Print our current PTB for comparison
-        tx = TransactionBuilder()
-        payment_obj = tx.object(self.object_id)
-        move_result = tx.move_call(
-            target=f"{self.sui_address_hex}::display::new",
-            arguments=[payment_obj],
-            type_arguments=[f"{self.sui_address_hex}::capy::Capy"]
-        )
-        ptb = tx.build()
-        our_ptb = ptb.to_bytes()
-        
-        print(f"Our PTB:      {our_ptb.hex()}")
-        print(f"Expected PTB: {expected_ptb.hex()}")
-        print()
-        
-        # Let's analyze the structure
-        print("Structure analysis:")
-        print(f"Expected first 10 bytes: {expected_ptb[:10].hex()}")
-        print(f"Our first 10 bytes:      {our_ptb[:10].hex()}")
-        
-        assert True  # Always pass for debug
+# Coin and recipient for the transfer smoke test
+_SMOKE_COIN_ID = "0x1234567890abcdef1234567890abcdef1234567890abcdef1234567890abcdef"
+_SMOKE_COIN_VERSION = 7
+_SMOKE_COIN_DIGEST = base58.b58encode(bytes(range(32))).decode()
+_SMOKE_RECIPIENT = "0xabcdef1234567890abcdef1234567890abcdef1234567890abcdef1234567890ab"
 
-    def test_simple_argument_serialization(self):
-        """Debug test to check exact ObjectArgument serialization."""
-        print("\n=== SIMPLE ARGUMENT SERIALIZATION ===")
-        
-        from sui_py.types import ObjectRef
-        
-        # Create the exact object ref from C# test
-        payment_ref = ObjectRef(
-            object_id=self.object_id,
-            version=self.version,
-            digest=self.digest
-        )
-        
-        # Create ObjectArgument
-        obj_arg = ObjectArgument(payment_ref)
-        
-        # Serialize just the argument
-        arg_bytes = serialize(obj_arg)
-        print(f"ObjectArgument serialized: {arg_bytes.hex()}")
-        print(f"ObjectArgument length: {len(arg_bytes)} bytes")
-        
-        # First byte should be the argument type (1 for Object)
-        if len(arg_bytes) > 0:
-            first_byte = arg_bytes[0]
-            print(f"First byte (should be 1 for Object): {first_byte}")
-            if first_byte == 1:
-                print("✓ Correct ObjectArgument type tag")
-            else:
-                print(f"❌ Wrong argument type tag, expected 1, got {first_byte}")
-        
-        assert True  # Always pass for debug
 
-    def test_simple_command_serialization(self):
-        """Debug test to check exact MoveCallCommand serialization."""
-        print("\n=== SIMPLE COMMAND SERIALIZATION ===")
-        
-        from sui_py.transactions.commands import MoveCall
-        from sui_py.types import ObjectRef
-        
-        # Create the exact object ref from C# test
-        payment_ref = ObjectRef(
-            object_id=self.object_id,
-            version=self.version,
-            digest=self.digest
-        )
-        
-        # Create ObjectArgument
-        obj_arg = ObjectArgument(payment_ref)
-        
-        # Create MoveCall
-        move_call = MoveCall(
-            package=self.sui_address_hex,
-            module="display", 
-            function="new",
-            arguments=[obj_arg],
-            type_arguments=[f"{self.sui_address_hex}::capy::Capy"]
-        )
-        
-        # Serialize just the command
-        cmd_bytes = serialize(move_call)
-        print(f"MoveCall serialized: {cmd_bytes.hex()}")
-        print(f"MoveCall length: {len(cmd_bytes)} bytes")
-        
-        # First byte should be the command type (0 for MoveCall)
-        if len(cmd_bytes) > 0:
-            first_byte = cmd_bytes[0]
-            print(f"First byte (should be 0 for MoveCall): {first_byte}")
-            if first_byte == 0:
-                print("✓ Correct MoveCall type tag")
-            else:
-                print(f"❌ Wrong command type tag, expected 0, got {first_byte}")
-        
-        # Look for key patterns
-        if b"display" in cmd_bytes:
-            print("✓ 'display' found in command")
-        if b"new" in cmd_bytes:
-            print("✓ 'new' found in command")
-        if b"capy" in cmd_bytes:
-            print("✓ 'capy' found in command")
-        
-        assert True  # Always pass for debug
+def test_expected_single_input_layout():
+    """The known fields sit at their fixed offsets in the C# expected bytes."""
+    for name, offset, needle in _EXPECTED_LAYOUT:
+        assert EXPECTED_SINGLE_INPUT[offset:offset + len(needle)] == needle, name
 
 
-def test_basic_transaction_serialization():
+@pytest.mark.asyncio
+async def test_basic_transaction_serialization(fresh_builder):
     """Basic smoke test for transaction serialization."""
-    print("Testing transaction serialization...")
+    tx = fresh_builder
     
-    tx = TransactionBuilder()
-    
-    # Create a simple transaction
-    coin = tx.object("0x1234567890abcdef1234567890abcdef1234567890abcdef1234567890abcdef")
-    recipient = tx.pure("0xabcdef1234567890abcdef1234567890abcdef1234567890abcdef1234567890ab")
+    # Create a simple transaction; the coin is fully referenced so no RPC is needed
+    coin = tx.object(_SMOKE_COIN_ID, _SMOKE_COIN_VERSION, _SMOKE_COIN_DIGEST)
+    recipient = tx.pure(_SMOKE_RECIPIENT)
     
     tx.transfer_objects([coin], recipient)
     
-    ptb = tx.build()
+    ptb = await tx.build_ptb()
     serialized = ptb.to_bytes()
     
-    print(f"Basic transaction serialized to {len(serialized)} bytes: {serialized[:20].hex()}...")
-    print("✓ Transaction serialization test passed!")
+    assert len(ptb.commands) == 1
+    assert len(serialized) > 0
+    assert bytes.fromhex(_SMOKE_COIN_ID[2:]) in serialized
+    
+    # Hex the prefix through a memoryview so the slice does not copy
+    log.debug("Basic transaction serialized to %d bytes: %s...",
+              len(serialized), memoryview(serialized)[:20].hex())
 
 
 if __name__ == "__main__":
-    # Run basic functionality test
-    test_basic_transaction_serialization()
-    print("\n🎉 Transaction serialization is working correctly!") 
\ No newline at end of file
+    pytest.main([__file__]) 
\ No newline at end of file
@@ -1,32 +1,59 @@
 #!/usr/bin/env python3
+"""
+Tests for Move TypeTag parsing and serialization.
+"""
 
-import sys
-import os
-sys.path.insert(0, '.')
+import dataclasses
 
+import pytest
+
+from sui_py.types import SuiAddress
 from sui_py.types.type_tag import parse_type_tag, StructTypeTag
 from sui_py.bcs import serialize
 
-# Test the specific type from our failing test
+# The type argument used by the C# Move call tests
 type_str = "0x0000000000000000000000000000000000000000000000000000000000000002::capy::Capy"
 
-print(f"Parsing type string: {type_str}")
-type_tag = parse_type_tag(type_str)
-print(f"Parsed TypeTag: {type_tag}")
-print(f"TypeTag type: {type(type_tag)}")
-
-if isinstance(type_tag, StructTypeTag):
-    print(f"Address: {type_tag.address}")
-    print(f"Module: {type_tag.module}")
-    print(f"Name: {type_tag.name}")
-    print(f"Type params: {type_tag.type_params}")
-
-# Test serialization
-serialized = serialize(type_tag)
-print(f"Serialized length: {len(serialized)} bytes")
-print(f"Serialized hex: {serialized.hex()}")
-
-# Compare with expected pattern from debug
-expected_pattern = "07000000000000000000000000000000000000000000000000000000000000000204636170790443617079000"
-print(f"Expected pattern: {expected_pattern}")
-print(f"Matches expected: {serialized.hex().startswith(expected_pattern[:-1])}")  # Remove last '0' in case 
\ No newline at end of file
+# Struct variant (7), 32-byte address, "capy", "Capy", no type parameters
+EXPECTED_CAPY_TAG = bytes.fromhex(
+    "07" + "00" * 31 + "02" + "04" + b"capy".hex() + "04" + b"Capy".hex() + "00"
+)
+
+
+def test_parse_and_serialize_struct_tag():
+    """Parse the Capy struct type and check its BCS encoding."""
+    type_tag = parse_type_tag(type_str)
+    
+    assert isinstance(type_tag, StructTypeTag)
+    assert type_tag.address == SuiAddress(type_str.split("::")[0])
+    assert type_tag.module == "capy"
+    assert type_tag.name == "Capy"
+    assert type_tag.type_params == ()
+    
+    assert serialize(type_tag) == EXPECTED_CAPY_TAG
+
+
+def test_parse_type_tag_is_cached():
+    """Repeated type strings share one frozen TypeTag instance."""
+    first = parse_type_tag(type_str)
+    assert parse_type_tag(type_str) is first
+    
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        first.module = "coin"
+
+
+def test_cached_generic_tag_is_immutable():
+    """A shared generic tag cannot be changed by one caller and is hashable."""
+    coin_type = "0x2::coin::Coin<0x2::sui::SUI>"
+    tag = parse_type_tag(coin_type)
+    
+    assert isinstance(tag.type_params, tuple)
+    with pytest.raises(AttributeError):
+        tag.type_params.append(parse_type_tag("u64"))
+    assert len(parse_type_tag(coin_type).type_params) == 1
+    
+    assert hash(tag) == hash(parse_type_tag(coin_type))
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])